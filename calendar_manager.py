@@ -1,18 +1,34 @@
 # Import necessary modules and libraries for functionality
-from datetime import datetime, timedelta  # Handle dates and time durations
+from datetime import date, datetime, timedelta, timezone  # Handle dates and durations
 import logging  # Enable logging for debugging and monitoring
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+)  # Write the log file off-thread
+import atexit  # Flush queued log records on exit
+import queue  # Hand log records to the log file writer thread
 import os  # Interact with the operating system (e.g., file paths, environment variables)
 import sys  # Access system-specific parameters and functions
+import tempfile  # Stage token.json writes before swapping them in
+import threading  # Run background token refreshes
+import time  # Measure elapsed time for cache expiry
 import csv  # Read and write CSV files
+import functools  # Cache the lazily created API service
 import json  # Parse JSON data
+import random  # Add jitter to retry delays
+import re  # Validate date and time strings
+from types import MappingProxyType  # Read-only views of the configuration
+import httplib2  # HTTP client used by the Google API client
 from dotenv import load_dotenv  # Load environment variables from a .env file
 from googleapiclient.discovery import build  # Interact with Google APIs
+from googleapiclient.errors import HttpError  # Errors returned by Google APIs
 from google.oauth2.credentials import Credentials  # Handle Google OAuth credentials
 from google_auth_oauthlib.flow import (
     InstalledAppFlow,
 )  # Manage OAuth 2.0 authentication flow
 from google.auth.transport.requests import Request
-from google.auth.exceptions import RefreshError
+from google_auth_httplib2 import AuthorizedHttp  # Authorize httplib2 requests
+from google.auth.exceptions import RefreshError, TransportError
 
 # ✅ Load environment variables from the .env file
 # Environment variables store sensitive data (like API keys) securely outside the codebase.
@@ -28,21 +44,92 @@ LOG_FILE = os.path.join(LOG_DIR, "calendar_manager.log")
 # Ensure the log directory exists. If it doesn't, create it.
 os.makedirs(LOG_DIR, exist_ok=True)
 
+# Console output is meant for the user, so it shows only the message itself;
+# the log file keeps timestamps and levels. Results such as created event links and
+# import totals are logged at INFO, so the console always shows INFO and above,
+# whatever LOG_LEVEL is set to.
+console_handler = logging.StreamHandler(stream=sys.stdout)
+console_handler.setFormatter(logging.Formatter("%(message)s"))
+console_handler.setLevel(logging.INFO)
+
+# The log file is written by a background thread, so bulk operations logging a line
+# per event don't wait on a file write and flush for each one. Records are formatted
+# (timestamp included) when they are logged, then queued; the listener writes the
+# finished text as is. The console stays synchronous so messages keep their place
+# between prompts.
+log_queue = queue.SimpleQueue()
+file_log_listener = QueueListener(
+    log_queue, logging.FileHandler(LOG_FILE, encoding="utf-8")
+)  # Save logs to a file with UTF-8 encoding
+file_log_listener.start()
+atexit.register(file_log_listener.stop)  # Write out any queued records before exiting
+
+# Write messages at LOG_LEVEL and above (DEBUG, INFO, WARNING, ERROR) to the log file;
+# defaults to INFO. An unknown name falls back to INFO instead of failing before the
+# menu starts.
+LOG_LEVEL_NAME = (os.getenv("LOG_LEVEL") or "INFO").strip().upper()
+LOG_LEVEL = getattr(logging, LOG_LEVEL_NAME, None)
+log_level_is_valid = isinstance(LOG_LEVEL, int)
+if not log_level_is_valid:
+    LOG_LEVEL = logging.INFO
+
+file_queue_handler = QueueHandler(log_queue)  # Queue records for the log file
+file_queue_handler.setLevel(LOG_LEVEL)
+
 # Set up logging configuration
 logging.basicConfig(
-    level=logging.DEBUG,  # Log all messages from DEBUG level and above (DEBUG, INFO, WARNING, ERROR)
+    # Let through everything either the log file or the console wants
+    level=min(LOG_LEVEL, logging.INFO),
     format="%(asctime)s [%(levelname)s] %(message)s",  # Define the log message format
     handlers=[
-        logging.FileHandler(
-            LOG_FILE, encoding="utf-8"
-        ),  # Save logs to a file with UTF-8 encoding
-        logging.StreamHandler(stream=sys.stdout),  # Display logs in the console
+        file_queue_handler,
+        console_handler,  # Display logs in the console
     ],
 )
 
+if not log_level_is_valid:
+    logging.warning("❌ Unknown LOG_LEVEL '%s', using INFO.", LOG_LEVEL_NAME)
+
 # Log an initial debug message to confirm that logging is set up correctly
 logging.debug("✅ Logging system initialized successfully.")
 
+# ✅ Validate Environment Variables
+REQUIRED_ENV_VARS = frozenset(
+    {
+        "GOOGLE_CALENDAR_CLIENT_ID",  # Google API Client ID
+        "GOOGLE_CALENDAR_CLIENT_SECRET",  # Google API Client Secret
+        "GOOGLE_CALENDAR_TOKEN",  # Access token for Google Calendar API
+        "GOOGLE_CALENDAR_REFRESH_TOKEN",  # Refresh token for long-term authentication
+        "DEFAULT_TIMEZONE",  # Default timezone for calendar events
+    }
+)
+
+
+def validate_env_variables():
+    """
+    Validate that all required environment variables are set.
+
+    Environment variables store sensitive information like API keys and tokens.
+    This function ensures that all necessary variables are present and correctly set.
+
+    Raises:
+        EnvironmentError: If any variable in REQUIRED_ENV_VARS is missing or empty.
+    """
+    # ✅ Collect every missing (or empty) variable in a single pass over the set
+    missing_vars = sorted(var for var in REQUIRED_ENV_VARS if not os.environ.get(var))
+
+    if missing_vars:
+        # If there are missing variables, log and raise an error
+        missing_vars_str = ", ".join(missing_vars)
+        logging.error("❌ Missing required environment variables: %s", missing_vars_str)
+        raise EnvironmentError(
+            f"❌ Missing required environment variables: {missing_vars_str}"
+        )
+
+    # Log a success message if all variables are validated
+    logging.debug("✅ Environment variables validated successfully.")
+
+
 # ✅ Google Calendar Credentials
 # Environment variables are used to securely store credentials and configuration for the Google Calendar API.
 
@@ -67,47 +154,185 @@ try:
         "DEFAULT_TIMEZONE", "America/Chicago"
     )  # Default timezone for calendar events
 
-    # Load additional configurations for calendars, colors, and templates
-    calendars = json.loads(
-        os.getenv("CALENDAR_NAMES", "{}")
+    # Load additional configurations for calendars, colors, and templates.
+    # They are parsed once and exposed read-only, so nothing can change them mid-run;
+    # a value that isn't a JSON object is rejected here with a TypeError.
+    calendars = MappingProxyType(
+        json.loads(os.getenv("CALENDAR_NAMES", "{}"))
     )  # Calendar names with associated colors
-    color_map = json.loads(
-        os.getenv("COLOR_MAP", "{}")
+    color_map = MappingProxyType(
+        json.loads(os.getenv("COLOR_MAP", "{}"))
     )  # Color map for calendar events
-    event_templates = json.loads(
-        os.getenv("EVENT_TEMPLATES", "{}")
+    event_templates = MappingProxyType(
+        json.loads(os.getenv("EVENT_TEMPLATES", "{}"))
     )  # Predefined event templates
 
+    # Resolve each calendar's hex color to its event colorId once, so event creation
+    # does a single lookup instead of going through `calendars` and `color_map`
+    DEFAULT_CALENDAR_COLOR = "#236192"  # Used for calendars missing from CALENDAR_NAMES
+    DEFAULT_EVENT_COLOR_ID = color_map.get(DEFAULT_CALENDAR_COLOR, "1")
+    calendar_color_ids = MappingProxyType(
+        {name: color_map.get(color_hex, "1") for name, color_hex in calendars.items()}
+    )  # Calendar name -> event colorId
+
+    # Template names in menu order, shared by every template menu
+    TEMPLATE_KEYS = tuple(event_templates)
+
     # ✅ Validate Critical Environment Variables
     # Ensure that all required environment variables are present and correctly set.
-    required_env_vars = [
-        "GOOGLE_CALENDAR_CLIENT_ID",
-        "GOOGLE_CALENDAR_CLIENT_SECRET",
-        "GOOGLE_CALENDAR_TOKEN",
-        "GOOGLE_CALENDAR_REFRESH_TOKEN",
-        "DEFAULT_TIMEZONE",
-    ]
-
-    # Loop through each required variable and check if it is set
-    for var in required_env_vars:
-        if not os.getenv(var):
-            # Raise an error if a required variable is missing
-            raise EnvironmentError(f"❌ Missing required environment variable: {var}")
+    validate_env_variables()
 
     # Log successful environment variable validation
     logging.debug("✅ Environment variables loaded and validated successfully.")
 
 # Handle errors that might occur while loading or validating environment variables
-except (json.JSONDecodeError, EnvironmentError) as e:
+except (json.JSONDecodeError, TypeError, EnvironmentError) as e:
     # Log the error details
-    logging.error(f"❌ Error with environment setup: {e}")
+    logging.error("❌ Error with environment setup: %s", e)
     # Exit the program because critical environment variables are missing or misconfigured
     raise SystemExit(
         "❌ Critical environment variables are missing or misconfigured. Exiting..."
     )
 
 
+# ✅ Save Token
+TOKEN_FILE = "token.json"  # Where OAuth credentials are stored between runs
+
+
+def save_token(creds):
+    """
+    Atomically write credentials to TOKEN_FILE.
+
+    Args:
+        creds (Credentials): The credentials to save.
+
+    Explanation:
+        - The token is written to a temporary file in the same directory and then swapped
+          in with `os.replace`, which is atomic on both POSIX and Windows.
+        - A crash mid-write leaves the previous token.json intact instead of an empty file,
+          so the next start can still refresh rather than re-run the browser OAuth flow.
+    """
+    token_dir = os.path.dirname(os.path.abspath(TOKEN_FILE))
+    tmp = tempfile.NamedTemporaryFile(
+        "w", dir=token_dir, suffix=".tmp", delete=False, encoding="utf-8"
+    )
+    try:
+        # Closing the file flushes it, so a full disk can fail here as well
+        with tmp:
+            tmp.write(creds.to_json())
+        os.replace(tmp.name, TOKEN_FILE)
+    except BaseException:
+        # ✅ Don't leave the temporary file behind if the write or the swap fails
+        try:
+            os.remove(tmp.name)
+        except OSError:
+            pass
+        raise
+
+
+# ✅ Background Token Refresh
+# Access tokens last about an hour. Refreshing them shortly before they expire keeps
+# API calls from stalling on a synchronous refresh in the middle of a long session.
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)  # Refresh this long before expiry
+_token_refresh_lock = threading.Lock()  # Prevent overlapping refreshes
+
+# Every refresh goes through one pooled requests.Session, so repeated refreshes reuse
+# the keep-alive connection to the token endpoint instead of a new TLS handshake.
+_refresh_request = Request()
+TOKEN_REFRESH_ATTEMPTS = 3  # Tries per refresh when the token endpoint can't be reached
+
+
+def refresh_credentials(creds):
+    """
+    Refresh the access token and save it to token.json.
+
+    Args:
+        creds (Credentials): The credentials to refresh in place.
+
+    Raises:
+        RefreshError: If the refresh token was rejected.
+        TransportError: If the token endpoint still can't be reached after
+            TOKEN_REFRESH_ATTEMPTS tries.
+
+    Explanation:
+        - Each try gives up after HTTP_TIMEOUT seconds instead of hanging on a dead
+          connection.
+        - Connection errors and timeouts are retried with exponential backoff and jitter;
+          a rejected refresh token is not, since retrying can't fix it.
+    """
+    with _token_refresh_lock:
+        for attempt in range(TOKEN_REFRESH_ATTEMPTS):
+            try:
+                creds.refresh(functools.partial(_refresh_request, timeout=HTTP_TIMEOUT))
+                break
+            except TransportError as e:
+                if attempt == TOKEN_REFRESH_ATTEMPTS - 1:
+                    raise
+                delay = 2**attempt + random.random()
+                logging.warning(
+                    "❌ Token refresh failed (%s), retrying in %.1f seconds...",
+                    e,
+                    delay,
+                )
+                time.sleep(delay)
+
+        save_token(creds)
+
+
+def schedule_token_refresh(creds):
+    """
+    Schedule a background refresh of the access token shortly before it expires.
+
+    Args:
+        creds (Credentials): The credentials used by the Calendar service.
+
+    Explanation:
+        - Runs on a daemon timer thread, so it never blocks the menu or keeps the program alive.
+        - Does nothing for credentials without an expiry time or a refresh token.
+    """
+    if not creds.expiry or not creds.refresh_token:
+        return
+
+    # `creds.expiry` is a naive UTC datetime
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    delay = (creds.expiry - TOKEN_REFRESH_MARGIN - now).total_seconds()
+
+    timer = threading.Timer(max(delay, 0), refresh_token_in_background, args=(creds,))
+    timer.daemon = True
+    timer.start()
+    logging.debug("⏰ Next token refresh scheduled in %.0f seconds.", max(delay, 0))
+
+
+def refresh_token_in_background(creds):
+    """
+    Refresh the access token, save it to token.json, and schedule the next refresh.
+
+    Args:
+        creds (Credentials): The credentials to refresh in place.
+
+    Explanation:
+        - If the refresh fails, the token is left as is; the API client refreshes
+          expired tokens on demand, so nothing is lost.
+    """
+    try:
+        refresh_credentials(creds)
+        logging.debug("🔄 Access token refreshed in the background.")
+    except (RefreshError, TransportError, OSError) as e:
+        logging.warning(
+            "❌ Background token refresh failed (%s), will refresh on demand.", e
+        )
+        return
+
+    schedule_token_refresh(creds)
+
+
 # ✅ Authentication for Google Calendar API
+HTTP_TIMEOUT = 30  # Seconds to wait on a Google API connection before giving up
+# Retries googleapiclient makes, with exponential backoff, when a single call hits a
+# rate limit (429 or 403 rateLimitExceeded), a server error, or a connection error
+API_NUM_RETRIES = 5
+
+
 def authenticate_google_calendar():
     """
     Authenticate and return a Google Calendar API service instance.
@@ -115,24 +340,23 @@ def authenticate_google_calendar():
     - Loads credentials from token.json if it exists.
     - Automatically refreshes expired tokens.
     - Falls back to a full OAuth flow if no valid credentials remain.
+    - Schedules a background refresh shortly before the access token expires.
     """
     creds = None
 
     # 1️⃣ Try loading existing credentials
-    if os.path.exists("token.json"):
-        creds = Credentials.from_authorized_user_file("token.json", SCOPES)
+    if os.path.exists(TOKEN_FILE):
+        creds = Credentials.from_authorized_user_file(TOKEN_FILE, SCOPES)
         logging.debug("✅ Loaded credentials from token.json.")
 
         # 2️⃣ If expired, attempt a refresh
         if creds.expired and creds.refresh_token:
             try:
                 logging.info("🔄 Token expired, attempting refresh...")
-                creds.refresh(Request())
-                with open("token.json", "w") as t:
-                    t.write(creds.to_json())
+                refresh_credentials(creds)
                 logging.info("✅ Token refreshed and saved to token.json.")
             except RefreshError as e:
-                logging.warning(f"❌ Refresh failed ({e}), will re‐authenticate.")
+                logging.warning("❌ Refresh failed (%s), will re‐authenticate.", e)
                 creds = None
 
     # 3️⃣ If we still don’t have valid creds, run the full OAuth flow
@@ -140,52 +364,38 @@ def authenticate_google_calendar():
         try:
             flow = InstalledAppFlow.from_client_secrets_file("credentials.json", SCOPES)
             creds = flow.run_local_server(port=0)
-            with open("token.json", "w") as t:
-                t.write(creds.to_json())
+            save_token(creds)
             logging.info("✅ New credentials obtained and saved to token.json.")
         except Exception as e:
-            logging.error(f"❌ OAuth flow failed: {e}")
+            logging.error("❌ OAuth flow failed: %s", e)
             raise SystemExit("❌ Failed to authenticate with Google Calendar API.")
 
-    # 4️⃣ Build and return the service
-    logging.debug("✅ Google Calendar authentication successful.")
-    return build("calendar", "v3", credentials=creds)
-
+    # 4️⃣ Keep the token fresh in the background for long sessions
+    schedule_token_refresh(creds)
 
-# initialize
-service = authenticate_google_calendar()
+    # 5️⃣ Build and return the service on a single authorized HTTP transport.
+    # httplib2 keeps connections alive per host, so every API call made through
+    # this service reuses the same TLS connection instead of opening a new one.
+    # The discovery document comes from the copy bundled with google-api-python-client,
+    # so startup never waits on a download from googleapis.com.
+    http = AuthorizedHttp(creds, http=httplib2.Http(timeout=HTTP_TIMEOUT))
+    logging.debug("✅ Google Calendar authentication successful.")
+    return build(
+        "calendar", "v3", http=http, static_discovery=True, cache_discovery=False
+    )
 
 
-# ✅ Validate Environment Variables
-def validate_env_variables():
+# ✅ Lazily Initialized Service
+@functools.cache
+def get_service():
     """
-    Validate that all required environment variables are set.
+    Return the shared Google Calendar API service, authenticating on first use.
 
-    Environment variables store sensitive information like API keys and tokens.
-    This function ensures that all necessary variables are present and correctly set.
+    Explanation:
+        - Importing this module no longer triggers authentication or an OAuth browser flow.
+        - The service is created once and reused for the rest of the process.
     """
-    # Define a list of required environment variables
-    required_vars = [
-        "GOOGLE_CALENDAR_CLIENT_ID",  # Google API Client ID
-        "GOOGLE_CALENDAR_CLIENT_SECRET",  # Google API Client Secret
-        "GOOGLE_CALENDAR_TOKEN",  # Access token for Google Calendar API
-        "GOOGLE_CALENDAR_REFRESH_TOKEN",  # Refresh token for long-term authentication
-        "DEFAULT_TIMEZONE",  # Default timezone for calendar events
-    ]
-
-    # Check if any of the required variables are missing
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
-
-    if missing_vars:
-        # If there are missing variables, log and raise an error
-        missing_vars_str = ", ".join(missing_vars)
-        logging.error(f"❌ Missing required environment variables: {missing_vars_str}")
-        raise EnvironmentError(
-            f"❌ Missing required environment variables: {missing_vars_str}"
-        )
-
-    # Log a success message if all variables are validated
-    logging.debug("✅ Environment variables validated successfully.")
+    return authenticate_google_calendar()
 
 
 # ✅ List Calendars
@@ -197,17 +407,23 @@ def list_calendars():
     """
     try:
         # ✅ Fetch the list of calendars from the user's Google account using the Google Calendar API
-        calendars_list = service.calendarList().list().execute()
+        # Only the name and ID of each calendar are displayed
+        calendar_items = list(
+            iter_list_items(
+                get_service().calendarList(),
+                "items(id,summary)",
+                maxResults=CALENDAR_PAGE_SIZE,
+            )
+        )
 
         # ✅ Check if the response contains any calendars
-        if not calendars_list.get("items"):
-            print("❌ No calendars found.")
+        if not calendar_items:
             logging.warning("No calendars found in the user's calendar list.")
             return
 
         # ✅ Loop through the list of calendars and display their names and IDs
         print("\n📅 Available Calendars:")
-        for calendar in calendars_list["items"]:
+        for calendar in calendar_items:
             print(
                 f"- {calendar['summary']} (ID: {calendar['id']})"
             )  # Display calendar name and ID
@@ -216,8 +432,7 @@ def list_calendars():
 
     except Exception as e:
         # ✅ Catch and log any errors that happen while fetching calendars
-        logging.error(f"❌ Failed to list calendars: {e}")
-        print(f"❌ Error listing calendars: {e}")
+        logging.error("❌ Failed to list calendars: %s", e)
 
 
 # ✅ Create Calendar
@@ -239,26 +454,75 @@ def create_calendar(name):
 
     try:
         # ✅ Send a request to the Google Calendar API to create a new calendar
-        created_calendar = service.calendars().insert(body=calendar).execute()
+        created_calendar = (
+            get_service()
+            .calendars()
+            .insert(body=calendar)
+            .execute(num_retries=API_NUM_RETRIES)
+        )
+
+        # ✅ The cached calendar list no longer includes every calendar
+        invalidate_calendar_cache()
 
         # ✅ Print and log the success message with the new calendar's name and ID
         print(
             f"✅ Calendar created: {created_calendar['summary']} (ID: {created_calendar['id']})"
         )
         logging.debug(
-            f"✅ Calendar '{name}' created successfully with ID: {created_calendar['id']}."
+            "✅ Calendar '%s' created successfully with ID: %s.",
+            name,
+            created_calendar["id"],
         )
 
         return created_calendar["id"]  # Return the ID of the created calendar
 
     except Exception as e:
         # ✅ Handle errors that may occur during calendar creation
-        logging.error(f"❌ Error creating calendar '{name}': {e}")
-        print(f"❌ Error creating calendar '{name}': {e}")
+        logging.error("❌ Error creating calendar '%s': %s", name, e)
 
         return None
 
 
+# ✅ Build Event Body
+# Every event gets the same reminders. The dict is shared by all request bodies:
+# googleapiclient only serializes a body, it never modifies it.
+EVENT_REMINDERS = {
+    "useDefault": False,  # Override default reminders
+    "overrides": [
+        {"method": "email", "minutes": 30},  # Email reminder 30 minutes before event
+        {"method": "popup", "minutes": 10},  # Popup reminder 10 minutes before event
+    ],
+}
+
+# Partial response for inserts: only the new event's ID and link are sent back,
+# not a copy of everything that was just uploaded
+CREATED_EVENT_FIELDS = "id,htmlLink"
+
+
+def build_event(summary, start_time, end_time, color_id=None):
+    """
+    Build the request body for a new event.
+
+    Args:
+        summary (str): A brief description or title for the event.
+        start_time (str): Event start time in ISO 8601 format (e.g., "2024-06-01T10:00:00").
+        end_time (str): Event end time in ISO 8601 format (e.g., "2024-06-01T11:00:00").
+        color_id (str, optional): The Google Calendar color ID to apply to the event.
+
+    Returns:
+        dict: The event body, ready to pass to `events().insert()`.
+    """
+    event = {
+        "summary": summary,  # The event's title or brief description
+        "start": {"dateTime": start_time, "timeZone": DEFAULT_TIMEZONE},
+        "end": {"dateTime": end_time, "timeZone": DEFAULT_TIMEZONE},
+        "reminders": EVENT_REMINDERS,
+    }
+    if color_id is not None:
+        event["colorId"] = color_id  # Apply the appropriate color ID to the event
+    return event
+
+
 # ✅ Create Event
 def create_event(calendar_name, summary, start_time, end_time):
     """
@@ -269,118 +533,190 @@ def create_event(calendar_name, summary, start_time, end_time):
         summary (str): A brief description or title for the event.
         start_time (str): Event start time in ISO 8601 format (e.g., "2024-06-01T10:00:00").
         end_time (str): Event end time in ISO 8601 format (e.g., "2024-06-01T11:00:00").
+
+    Returns:
+        dict: The created event's id and htmlLink if successful, otherwise None.
     """
     # ✅ Retrieve the calendar ID using the calendar's name
     calendar_id = get_calendar_id(calendar_name)
     if not calendar_id:
-        logging.warning(f"❌ Calendar '{calendar_name}' not found!")
-        print(f"❌ Calendar '{calendar_name}' not found!")
-        return
+        logging.warning("❌ Calendar '%s' not found!", calendar_name)
+        return None
+
+    return insert_event(calendar_id, calendar_name, summary, start_time, end_time)
+
 
+def insert_event(
+    calendar_id, calendar_name, summary, start_time, end_time, validate=True
+):
+    """
+    Add an event to a calendar whose ID is already known.
+
+    Args:
+        calendar_id (str): The ID of the calendar where the event will be added.
+        calendar_name (str): The calendar's name, used to pick the event color.
+        summary (str): A brief description or title for the event.
+        start_time (str): Event start time in ISO 8601 format (e.g., "2024-06-01T10:00:00").
+        end_time (str): Event end time in ISO 8601 format (e.g., "2024-06-01T11:00:00").
+        validate (bool): Check the time range first; callers that built the times
+            themselves and know they're valid can skip it.
+
+    Returns:
+        dict: The created event's id and htmlLink if successful, otherwise None.
+
+    Explanation:
+        - Callers that already resolved the calendar ID use this instead of `create_event`,
+          so the calendar isn't looked up a second time.
+    """
     try:
         # ✅ Validate that the start time is earlier than the end time
-        start = datetime.fromisoformat(start_time)
-        end = datetime.fromisoformat(end_time)
-        if start >= end:
+        if validate and not is_valid_time_range(start_time, end_time):
             logging.warning("❌ Error: Start time must be earlier than end time.")
-            print("❌ Error: Start time must be earlier than end time.")
-            return
+            return None
 
         # ✅ Match the event's color based on the calendar's configuration
-        # Get the color hex from calendar configuration, fallback to default if not found
-        color_hex = calendars.get(calendar_name, "#236192")
-        # Map the hex color to the corresponding Google Calendar color ID
-        color_id = color_map.get(color_hex, "1")
+        color_id = calendar_color_ids.get(calendar_name, DEFAULT_EVENT_COLOR_ID)
 
         # ✅ Define the event's details
-        event = {
-            "summary": summary,  # The event's title or brief description
-            "start": {
-                "dateTime": start_time,
-                "timeZone": DEFAULT_TIMEZONE,
-            },  # Event start time with timezone
-            "end": {
-                "dateTime": end_time,
-                "timeZone": DEFAULT_TIMEZONE,
-            },  # Event end time with timezone
-            "colorId": color_id,  # Apply the appropriate color ID to the event
-            "reminders": {
-                "useDefault": False,  # Override default reminders
-                "overrides": [
-                    {
-                        "method": "email",
-                        "minutes": 30,
-                    },  # Email reminder 30 minutes before event
-                    {
-                        "method": "popup",
-                        "minutes": 10,
-                    },  # Popup reminder 10 minutes before event
-                ],
-            },
-        }
+        event = build_event(summary, start_time, end_time, color_id)
 
         # ✅ Send the event details to the Google Calendar API to create the event
         created_event = (
-            service.events().insert(calendarId=calendar_id, body=event).execute()
+            get_service()
+            .events()
+            .insert(calendarId=calendar_id, body=event, fields=CREATED_EVENT_FIELDS)
+            .execute(num_retries=API_NUM_RETRIES)
         )
 
         # ✅ Print and log a success message with a link to the created event
         print(f"✅ Event created: {created_event['htmlLink']}")
         logging.debug(
-            f"✅ Event '{summary}' created successfully in calendar '{calendar_name}'."
+            "✅ Event '%s' created successfully in calendar '%s'.",
+            summary,
+            calendar_name,
         )
+        return created_event
 
     except ValueError as ve:
         # ✅ Handle errors if the datetime format is incorrect
-        logging.error(f"❌ Invalid datetime format: {ve}")
-        print(f"❌ Invalid datetime format: {ve}")
+        logging.error("❌ Invalid datetime format: %s", ve)
 
     except Exception as e:
         # ✅ Catch and log any other errors during event creation
-        logging.error(f"❌ Error creating event: {e}")
-        print(f"❌ Error creating event: {e}")
+        logging.error("❌ Error creating event: %s", e)
+
+    return None
+
+
+# ✅ Validate Time Range
+# Zero-padded "YYYY-MM-DDTHH:MM[:SS]" datetimes sort chronologically as plain strings,
+# so the common case is checked without parsing either end into a datetime.
+# Anything else (fractional seconds, UTC offsets) goes through datetime.fromisoformat.
+ISO_DATETIME_RE = re.compile(
+    r"([0-9]{4})-(0[1-9]|1[0-2])-(0[1-9]|[12][0-9]|3[01])"
+    r"T(?:[01][0-9]|2[0-3]):[0-5][0-9](:[0-5][0-9])?"
+)
+
+
+def is_valid_time_range(start_time, end_time):
+    """
+    Check that a start time is earlier than an end time.
+
+    Args:
+        start_time (str): Start time in ISO 8601 format (e.g., "2024-06-01T10:00:00").
+        end_time (str): End time in ISO 8601 format (e.g., "2024-06-01T11:00").
+
+    Returns:
+        bool: True if start_time is earlier than end_time.
+
+    Raises:
+        ValueError: If either value is not a valid ISO 8601 datetime (including
+            impossible dates such as February 30), or if only one of them has a
+            UTC offset.
+    """
+    keys = []
+    for value in (start_time, end_time):
+        match = ISO_DATETIME_RE.fullmatch(value)
+        if not match:
+            break
+        # ✅ The pattern only checks ranges; reject days the month doesn't have
+        date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+        # ✅ Treat a missing seconds field as ":00" so both ends compare alike
+        keys.append(match.group(0) if match.group(4) else match.group(0) + ":00")
+    else:
+        return keys[0] < keys[1]
+
+    # ✅ Fractional seconds or UTC offsets: compare the parsed datetimes instead
+    start_dt = datetime.fromisoformat(start_time)
+    end_dt = datetime.fromisoformat(end_time)
+    try:
+        return start_dt < end_dt
+    except TypeError:
+        raise ValueError(
+            f"Can't compare a time with a UTC offset to one without: "
+            f"{start_time!r}, {end_time!r}"
+        ) from None
 
 
 # ✅ Prompt for Datetime
-def prompt_for_datetime(prompt_text):
+# Fields asked for by prompt_for_datetime: (name, prompt, lowest value, highest value)
+DATETIME_FIELDS = [
+    ("Year", "  Year (e.g., 2024): ", 1, 9999),
+    ("Month", "  Month (1-12): ", 1, 12),
+    ("Day", "  Day (1-31): ", 1, 31),
+    ("Hour", "  Hour (0-23): ", 0, 23),
+    ("Minute", "  Minute (0-59): ", 0, 59),
+]
+
+
+def prompt_for_datetime(prompt_text, allow_blank=False):
     """
     Prompt the user for a date and time in a structured format.
 
     Args:
         prompt_text (str): A message to guide the user (e.g., "Enter start date and time").
+        allow_blank (bool): Let the user skip the whole datetime by leaving the year blank.
 
     Returns:
-        str: An ISO 8601 formatted datetime string (e.g., "2024-06-01T10:00:00").
+        str: An ISO 8601 formatted datetime string (e.g., "2024-06-01T10:00:00"),
+            or None if the input was skipped.
 
     Explanation:
         - The function asks the user to input year, month, day, hour, and minute individually.
-        - It validates if the entered values form a valid date and time.
-        - If the input is invalid (e.g., non-numeric or out-of-range values), it retries the prompt.
+        - Each value is validated as soon as it is entered.
+        - If a value is invalid (e.g., non-numeric, out of range, or February 30), only that
+          value is asked for again; the values already entered are kept.
     """
     print(f"{prompt_text}:")  # Display the instruction to the user
-    try:
-        # ✅ Ask the user to input each part of the date and time
-        year = int(input("  Year (e.g., 2024): ").strip())  # Get the year from the user
-        month = int(input("  Month (1-12): ").strip())  # Get the month
-        day = int(input("  Day (1-31): ").strip())  # Get the day
-        hour = int(input("  Hour (0-23): ").strip())  # Get the hour
-        minute = int(input("  Minute (0-59): ").strip())  # Get the minute
 
-        # ✅ Create a datetime object using the provided inputs
-        datetime_obj = datetime(year, month, day, hour, minute)
+    values = []  # Validated values, in the order of DATETIME_FIELDS
+    for name, prompt, lowest, highest in DATETIME_FIELDS:
+        # ✅ Keep asking for this field until a valid value is entered
+        while True:
+            try:
+                text = input(prompt).strip()
+                # ✅ A blank year skips the datetime entirely when that's allowed
+                if allow_blank and not values and not text:
+                    return None
 
-        # ✅ Return the datetime as an ISO 8601 formatted string
-        return datetime_obj.isoformat()
+                value = int(text)
+                if not lowest <= value <= highest:
+                    raise ValueError(f"{name} must be in {lowest}..{highest}")
 
-    except ValueError as e:
-        # ✅ Handle invalid input (e.g., letters instead of numbers, out-of-range values)
-        logging.error(f"❌ Invalid datetime input: {e}")  # Log the error for debugging
-        print(
-            f"❌ Invalid datetime input: {e}"
-        )  # Inform the user about the invalid input
+                # ✅ Reject days that don't exist in the chosen month (e.g., February 30)
+                if name == "Day":
+                    datetime(values[0], values[1], value)
+
+            except ValueError as e:
+                # ✅ Handle invalid input (e.g., letters instead of numbers, out-of-range values)
+                logging.error("❌ Invalid datetime input: %s", e)  # Log the error
+                continue
 
-        # ✅ Retry the prompt recursively until valid input is received
-        return prompt_for_datetime(prompt_text)
+            values.append(value)
+            break
+
+    # ✅ Return the datetime as an ISO 8601 formatted string
+    return datetime(*values).isoformat()
 
 
 # ✅ Get Calendar ID
@@ -395,37 +731,455 @@ def get_calendar_id(calendar_name):
         str: The calendar ID if found, otherwise None.
 
     Explanation:
-        - The function fetches all calendars linked to the user's Google account.
-        - It then loops through each calendar and checks if its name matches the given calendar_name.
+        - The function looks the name up in the cached list of the user's calendars.
+        - If the name is missing from an older cached list, the list is fetched again once.
         - If a match is found, the function returns the calendar's unique ID.
         - If no match is found or if an error occurs, it handles the situation gracefully.
     """
     try:
-        # ✅ Fetch the list of calendars from the user's account
-        calendars_list = service.calendarList().list().execute()
-
-        # ✅ Loop through each calendar in the fetched list
-        for calendar in calendars_list.get("items", []):
-            # ✅ Check if the calendar name matches the given calendar_name
-            if calendar["summary"] == calendar_name:
-                # ✅ Log and return the calendar ID if found
-                logging.debug(
-                    f"✅ Found calendar '{calendar_name}' with ID: {calendar['id']}"
-                )
-                return calendar["id"]
+        # ✅ Look the name up in the cached calendar list
+        was_cached = is_calendar_cache_fresh()
+        calendar = get_calendar_entries().get(calendar_name)
+
+        # ✅ A miss against an older cache may be a calendar created elsewhere; refetch once
+        if calendar is None and was_cached:
+            calendar = get_calendar_entries(force_refresh=True).get(calendar_name)
+
+        if calendar is not None:
+            # ✅ Log and return the calendar ID if found
+            logging.debug(
+                "✅ Found calendar '%s' with ID: %s", calendar_name, calendar["id"]
+            )
+            return calendar["id"]
 
         # ✅ If no calendar matches the given name, log a warning and inform the user
-        logging.warning(f"❌ Calendar '{calendar_name}' not found.")
-        print(f"❌ Calendar '{calendar_name}' not found.")
+        logging.warning("❌ Calendar '%s' not found.", calendar_name)
         return None  # Return None if the calendar isn't found
 
     except Exception as e:
         # ✅ Handle unexpected errors gracefully (e.g., API errors, connectivity issues)
-        logging.error(f"❌ Error fetching calendar ID: {e}")  # Log the error
-        print(f"❌ Error fetching calendar ID: {e}")  # Inform the user about the error
+        logging.error("❌ Error fetching calendar ID: %s", e)  # Log the error
         return None  # Return None to indicate failure
 
 
+# ✅ Iterate List Results
+def iter_list_pages(collection, fields, **kwargs):
+    """
+    Yield every page of a paginated `list()` call.
+
+    Args:
+        collection: The API collection to list (e.g., `get_service().events()`).
+        fields (str): The partial response mask for each page (e.g., "items(id)").
+        **kwargs: Extra `list()` parameters (e.g., calendarId, maxResults, q).
+
+    Explanation:
+        - `nextPageToken` is added to the partial response mask and followed with
+          `list_next`, so results are never cut off at the first page.
+        - Use this instead of `iter_list_items` when page-level fields such as
+          `nextSyncToken` are needed.
+    """
+    request = collection.list(fields=f"nextPageToken,{fields}", **kwargs)
+    while request is not None:
+        response = request.execute(num_retries=API_NUM_RETRIES)
+        yield response
+        request = collection.list_next(request, response)
+
+
+def iter_list_items(collection, fields, **kwargs):
+    """
+    Yield every item of a paginated `list()` call, one page of results at a time.
+
+    Args:
+        collection: The API collection to list (e.g., `get_service().events()`).
+        fields (str): The `items(...)` partial response mask for each item.
+        **kwargs: Extra `list()` parameters (e.g., calendarId, maxResults, q).
+
+    Explanation:
+        - `nextPageToken` is added to the partial response mask and followed with
+          `list_next`, so results are never cut off at the first page.
+        - Items are yielded as each page arrives, so callers can start working before
+          later pages have been downloaded.
+    """
+    for response in iter_list_pages(collection, fields, **kwargs):
+        yield from response.get("items", [])
+
+
+# ✅ Calendar List Cache
+# Calendar lookups reuse one calendarList().list() response for a few minutes
+# instead of fetching the whole list again for every name lookup. A forced refresh
+# while the cache is fresh (a lookup miss) passes the sync token from the previous
+# fetch and only downloads the calendars added, changed, or removed since. Sync
+# results skip changes to read-only fields such as a calendar's name, so a stale or
+# invalidated cache is always fetched in full, which picks up renames.
+CALENDAR_CACHE_TTL = 300  # Seconds before the cached calendar list goes stale
+_calendar_cache = {}  # Calendar name -> calendar entry from calendarList().list()
+_calendar_cache_loaded_at = None  # time.monotonic() of the last successful fetch
+_calendars_by_id = {}  # Calendar ID -> calendar entry, in calendar list order
+_calendar_sync_token = None  # nextSyncToken of the last successful fetch
+# Partial response for the cache. Sync results also include removed (`deleted`) and
+# hidden calendars, which a full fetch leaves out, so both flags are requested.
+CALENDAR_FIELDS = "nextSyncToken,items(id,summary,colorId,deleted,hidden)"
+CALENDAR_PAGE_SIZE = 250  # Largest page calendarList().list() allows
+
+
+def is_calendar_cache_fresh():
+    """
+    Check whether the cached calendar list can still be used.
+
+    Returns:
+        bool: True if the calendar list was fetched less than CALENDAR_CACHE_TTL seconds ago.
+    """
+    return (
+        _calendar_cache_loaded_at is not None
+        and time.monotonic() - _calendar_cache_loaded_at < CALENDAR_CACHE_TTL
+    )
+
+
+def fetch_calendar_changes(sync_token=None):
+    """
+    Fetch the calendar list, or only what changed since an earlier fetch.
+
+    Args:
+        sync_token (str, optional): The nextSyncToken of an earlier fetch.
+            Without one, the whole calendar list is fetched.
+
+    Returns:
+        tuple: (list of calendar entries, sync token for the next fetch).
+            With a sync token, removed calendars come back marked `deleted`.
+
+    Raises:
+        HttpError: With status 410 if the sync token has expired.
+    """
+    calendar_items = []
+    sync_kwargs = {"syncToken": sync_token} if sync_token else {}
+    response = {}
+    for response in iter_list_pages(
+        get_service().calendarList(),
+        CALENDAR_FIELDS,
+        maxResults=CALENDAR_PAGE_SIZE,
+        **sync_kwargs,
+    ):
+        calendar_items.extend(response.get("items", []))
+
+    # The sync token comes with the last page
+    return calendar_items, response.get("nextSyncToken")
+
+
+def get_calendar_entries(force_refresh=False):
+    """
+    Return the user's calendars keyed by name.
+
+    Args:
+        force_refresh (bool): Fetch the calendar list even if the cache is still fresh.
+
+    Returns:
+        dict: Calendar name -> calendar entry as returned by calendarList().list().
+
+    Explanation:
+        - The calendar list is fetched once and reused until CALENDAR_CACHE_TTL expires.
+        - A forced refresh of a fresh cache only fetches the changes since the previous
+          fetch; if the sync token has expired (HTTP 410), the whole list is fetched
+          again. Once the cache is stale or invalidated, the whole list is fetched.
+        - Hidden calendars are left out, whichever way the list was fetched.
+        - If several calendars share a name, the first one listed wins (as before).
+        - Every page of the calendar list is read, so accounts with more calendars
+          than fit in one response are cached completely.
+    """
+    global _calendar_cache, _calendar_cache_loaded_at
+    global _calendars_by_id, _calendar_sync_token
+
+    if force_refresh or not is_calendar_cache_fresh():
+        # ✅ Only a fresh cache is updated incrementally; otherwise fetch everything
+        previous_token = _calendar_sync_token if is_calendar_cache_fresh() else None
+
+        # ✅ Apply the changes to a copy, so a failed refresh leaves the cache intact
+        calendars_by_id = dict(_calendars_by_id) if previous_token else {}
+        try:
+            calendar_items, sync_token = fetch_calendar_changes(previous_token)
+        except HttpError as e:
+            if e.resp.status != 410:
+                raise
+            # ✅ The sync token expired; start over with a full fetch
+            logging.debug("🔄 Calendar list sync token expired, fetching it again.")
+            calendars_by_id = {}
+            calendar_items, sync_token = fetch_calendar_changes()
+
+        for calendar in calendar_items:
+            if calendar.get("deleted") or calendar.get("hidden"):
+                calendars_by_id.pop(calendar["id"], None)
+            else:
+                calendars_by_id[calendar["id"]] = calendar
+
+        entries = {}
+        for calendar in calendars_by_id.values():
+            entries.setdefault(calendar["summary"], calendar)
+
+        _calendars_by_id = calendars_by_id
+        _calendar_sync_token = sync_token
+        _calendar_cache = entries
+        _calendar_cache_loaded_at = time.monotonic()
+        logging.debug(
+            "✅ Cached %s calendars from calendarList (%s changed).",
+            len(entries),
+            len(calendar_items),
+        )
+
+    return _calendar_cache
+
+
+def invalidate_calendar_cache():
+    """
+    Mark the cached calendar list as stale so the next lookup fetches it in full.
+
+    Call this after creating or modifying calendars.
+    """
+    global _calendar_cache_loaded_at
+    _calendar_cache_loaded_at = None
+
+
+# ✅ Execute Batch
+# Google Calendar accepts up to 1000 calls in a single batch request, but recommends
+# 50 or fewer; BATCH_SIZE in .env picks a different size within that limit.
+MAX_BATCH_SIZE = 1000
+try:
+    BATCH_SIZE = min(max(int(os.getenv("BATCH_SIZE", "50")), 1), MAX_BATCH_SIZE)
+except ValueError:
+    logging.error("❌ BATCH_SIZE must be a whole number: %s", os.getenv("BATCH_SIZE"))
+    raise SystemExit("❌ Critical environment variables are missing or misconfigured.")
+BATCH_MAX_RETRIES = 4  # Retries for calls that hit a rate limit or a server error
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+RATE_LIMIT_REASONS = frozenset({"rateLimitExceeded", "userRateLimitExceeded"})
+
+
+def is_retryable_error(exception):
+    """
+    Check whether a failed Google API call is worth retrying.
+
+    Args:
+        exception (Exception): The error a call failed with.
+
+    Returns:
+        bool: True for rate limits (429, or 403 with a rate limit reason) and server errors.
+    """
+    if not isinstance(exception, HttpError):
+        return False
+
+    status = exception.resp.status
+    if status in RETRYABLE_STATUSES:
+        return True
+
+    # ✅ Calendar reports most quota errors as 403 with a rate limit reason
+    details = getattr(exception, "error_details", None)
+    return (
+        status == 403
+        and isinstance(details, list)
+        and any(
+            isinstance(detail, dict) and detail.get("reason") in RATE_LIMIT_REASONS
+            for detail in details
+        )
+    )
+
+
+def send_batch(requests, callback, idempotent=False):
+    """
+    Send one batch of requests, retrying calls that fail with a transient error.
+
+    Args:
+        requests (list): Pairs of (request_id, HttpRequest), at most BATCH_SIZE of them.
+        callback (callable): Called as callback(request_id, response, exception) once per request.
+        idempotent (bool): The calls can safely be applied twice (e.g., setting a colorId).
+
+    Explanation:
+        - Calls that hit a rate limit or a server error are sent again in a smaller batch
+          after an exponential backoff (1s, 2s, 4s, ... plus jitter).
+        - If the batch request itself fails with a connection error or a timeout, there
+          is no telling which calls Google already applied. Idempotent calls that got no
+          response are sent again with the same backoff. Other calls (such as inserts,
+          which would create duplicates) are reported to the callback as failed.
+        - The callback only sees the final outcome of each call.
+    """
+    for attempt in range(BATCH_MAX_RETRIES + 1):
+        can_retry = attempt < BATCH_MAX_RETRIES
+        retry_ids = set()
+        answered_ids = set()  # Calls whose outcome already came back
+
+        def on_response(request_id, response, exception):
+            answered_ids.add(request_id)
+            if exception is not None and can_retry and is_retryable_error(exception):
+                retry_ids.add(request_id)
+                return
+            callback(request_id, response, exception)
+
+        batch = get_service().new_batch_http_request(callback=on_response)
+        for request_id, request in requests:
+            batch.add(request, request_id=request_id)
+
+        try:
+            batch.execute()
+        except HttpError as e:
+            # ✅ The whole batch was rejected; retry all of it if the error is transient
+            if not (can_retry and is_retryable_error(e)):
+                raise
+            retry_ids = {request_id for request_id, _ in requests}
+        except (OSError, httplib2.HttpLib2Error, TransportError) as e:
+            # ✅ Connection errors and timeouts (HTTP_TIMEOUT) are expected now and then.
+            # Callbacks only run once the whole response has been read, so usually none
+            # of the calls got an answer, even though Google may have applied them.
+            unanswered_ids = [
+                request_id
+                for request_id, _ in requests
+                if request_id not in answered_ids
+            ]
+            if idempotent and can_retry:
+                retry_ids.update(unanswered_ids)
+            else:
+                logging.warning(
+                    "❌ Connection lost before %s request(s) were confirmed (%s); they "
+                    "may or may not have been applied and are not sent again: %s",
+                    len(unanswered_ids),
+                    e,
+                    ", ".join(unanswered_ids),
+                )
+                for request_id in unanswered_ids:
+                    callback(request_id, None, e)
+
+        if not retry_ids:
+            return
+
+        delay = 2**attempt + random.random()
+        logging.warning(
+            "⏳ %s request(s) hit a rate limit, server error, or connection error, "
+            "retrying in %.1f seconds.",
+            len(retry_ids),
+            delay,
+        )
+        time.sleep(delay)
+        requests = [
+            (request_id, request)
+            for request_id, request in requests
+            if request_id in retry_ids
+        ]
+
+
+def execute_batch(requests, callback, idempotent=False):
+    """
+    Execute Google Calendar API requests in batches.
+
+    Args:
+        requests (iterable): Pairs of (request_id, HttpRequest) to execute.
+        callback (callable): Called as callback(request_id, response, exception) for every request.
+        idempotent (bool): The calls can safely be resent after a connection error
+            (see `send_batch`).
+
+    Explanation:
+        - Bundles up to BATCH_SIZE calls into a single multipart/mixed HTTP request.
+        - Requests are consumed lazily, so callers can stream them from a generator.
+        - Transient failures are retried with backoff (see `send_batch`).
+        - Other per-request failures are reported through the callback instead of being raised.
+    """
+    pending = []
+
+    for request_id, request in requests:
+        pending.append((request_id, request))
+
+        # ✅ Send the batch once it is full and start a new one
+        if len(pending) == BATCH_SIZE:
+            send_batch(pending, callback, idempotent)
+            pending = []
+
+    # ✅ Send any remaining requests
+    if pending:
+        send_batch(pending, callback, idempotent)
+
+
+# ✅ Iterate Events
+EVENTS_PAGE_SIZE = 2500  # Largest page events().list() allows
+
+
+def iter_events(calendar_id, fields, **kwargs):
+    """
+    Yield every event of a calendar, one page of results at a time.
+
+    Args:
+        calendar_id (str): The ID of the calendar to list events from.
+        fields (str): The `items(...)` partial response mask for each event.
+        **kwargs: Extra `events().list()` parameters (e.g., q, timeMin, orderBy).
+
+    Explanation:
+        - Large calendars are fetched in pages of EVENTS_PAGE_SIZE instead of stopping
+          at the API's default page of 250 events.
+        - Events are yielded as each page arrives, so callers can start working before
+          later pages have been downloaded.
+    """
+    yield from iter_list_items(
+        get_service().events(),
+        fields,
+        calendarId=calendar_id,
+        maxResults=EVENTS_PAGE_SIZE,
+        **kwargs,
+    )
+
+
+# ✅ Insert Events
+def insert_events(calendar_id, events):
+    """
+    Insert several events into one calendar using batch requests.
+
+    Args:
+        calendar_id (str): The ID of the calendar to add the events to.
+        events (list): Event bodies as returned by `build_event`.
+
+    Returns:
+        int: The number of events that were created.
+
+    Explanation:
+        - All events go to the same calendar, so up to BATCH_SIZE of them are sent in
+          a single HTTP request instead of one round trip per event.
+        - A failed event is logged and does not stop the others.
+        - The links to the created events are printed together once all batches are done.
+    """
+    created_lines = []  # "✅ Event created: <link>" for each created event
+
+    def on_insert(request_id, response, exception):
+        if exception is not None:
+            logging.error(
+                "❌ Error creating event '%s': %s",
+                events[int(request_id)]["summary"],
+                exception,
+            )
+            return
+
+        created_lines.append(f"✅ Event created: {response['htmlLink']}")
+        logging.debug(
+            "✅ Event '%s' created successfully.", events[int(request_id)]["summary"]
+        )
+
+    try:
+        execute_batch(
+            (
+                (
+                    str(index),
+                    get_service()
+                    .events()
+                    .insert(
+                        calendarId=calendar_id, body=event, fields=CREATED_EVENT_FIELDS
+                    ),
+                )
+                for index, event in enumerate(events)
+            ),
+            on_insert,
+        )
+    except Exception as e:
+        # ✅ Errors for the whole batch (e.g., connectivity issues) end up here
+        logging.error("❌ Error creating events: %s", e)
+
+    # ✅ Show the links to the created events, written out in a single call
+    if created_lines:
+        print("\n".join(created_lines))
+
+    return len(created_lines)
+
+
 # ✅ Add Event with Multiple Dates
 def add_event_with_multiple_dates(calendar_name):
     """
@@ -438,13 +1192,16 @@ def add_event_with_multiple_dates(calendar_name):
         - Prompts the user for an event summary.
         - Allows adding multiple occurrences of the event with different dates and times.
         - Validates each date range before adding it to the event list.
-        - Creates all the events in the specified calendar.
+        - Creates all the events in the specified calendar in batches.
     """
     # ✅ Get the calendar ID based on the provided calendar name
     calendar_id = get_calendar_id(calendar_name)
     if not calendar_id:
         return  # Exit if the calendar isn't found
 
+    # ✅ Match the events' color based on the calendar's configuration
+    color_id = calendar_color_ids.get(calendar_name, DEFAULT_EVENT_COLOR_ID)
+
     # ✅ Ask the user for a general event summary/title
     summary = input("Enter event summary (e.g., Twins vs Yankees): ").strip()
     events = []  # Create an empty list to store all event occurrences
@@ -459,45 +1216,35 @@ def add_event_with_multiple_dates(calendar_name):
 
         try:
             # ✅ Validate that the start time is earlier than the end time
-            start_dt = datetime.fromisoformat(start_time)
-            end_dt = datetime.fromisoformat(end_time)
-            if start_dt >= end_dt:
-                print("❌ Error: Start time must be earlier than end time.")
+            if not is_valid_time_range(start_time, end_time):
                 logging.warning("❌ Start time must be earlier than end time.")
                 continue  # Restart the loop if the validation fails
 
         except ValueError as e:
             # ✅ Handle invalid datetime inputs
-            print(f"❌ Invalid datetime format: {e}")
-            logging.error(f"❌ Invalid datetime format: {e}")
+            logging.error("❌ Invalid datetime format: %s", e)
             continue  # Restart the loop if the validation fails
 
         # ✅ Add the valid event occurrence to the list
-        events.append(
-            {"summary": summary, "start_time": start_time, "end_time": end_time}
-        )
+        events.append(build_event(summary, start_time, end_time, color_id))
 
         # ✅ Ask the user if they want to add more occurrences
         more = input("Add another date/time for this event? (y/n): ").strip().lower()
         if more != "y":
             break  # Exit the loop if the user is done
 
-    # ✅ Loop through the list of events and create them in the calendar
-    for event in events:
-        try:
-            create_event(
-                calendar_name, event["summary"], event["start_time"], event["end_time"]
-            )
-        except Exception as e:
-            print(f"❌ Error creating event '{event['summary']}': {e}")
-            logging.error(f"❌ Error creating event '{event['summary']}': {e}")
+    # ✅ Create all the occurrences in the calendar
+    added_count = insert_events(calendar_id, events)
 
     # ✅ Confirm successful addition of events
     print(
-        f"✅ {len(events)} occurrence(s) of '{summary}' added successfully to calendar '{calendar_name}'!"
+        f"✅ {added_count} occurrence(s) of '{summary}' added successfully to calendar '{calendar_name}'!"
     )
     logging.debug(
-        f"✅ {len(events)} occurrences of '{summary}' added to calendar '{calendar_name}'."
+        "✅ %s occurrences of '%s' added to calendar '%s'.",
+        added_count,
+        summary,
+        calendar_name,
     )
 
 
@@ -513,13 +1260,16 @@ def add_multiple_unique_events(calendar_name):
         - Allows the user to add multiple unique events one by one.
         - Each event requires a summary, start time, and end time.
         - Validates that the start time is earlier than the end time.
-        - Events are collected in a list and then added to the calendar one by one.
+        - Events are collected in a list and then added to the calendar in batches.
     """
     # ✅ Get the calendar ID based on the provided calendar name
     calendar_id = get_calendar_id(calendar_name)
     if not calendar_id:
         return  # Exit if the calendar isn't found
 
+    # ✅ Match the events' color based on the calendar's configuration
+    color_id = calendar_color_ids.get(calendar_name, DEFAULT_EVENT_COLOR_ID)
+
     events = []  # Create an empty list to store all unique events
 
     # ✅ Start a loop to continuously add events until the user stops
@@ -535,167 +1285,325 @@ def add_multiple_unique_events(calendar_name):
 
         try:
             # ✅ Validate that the start time is earlier than the end time
-            start_dt = datetime.fromisoformat(start_time)
-            end_dt = datetime.fromisoformat(end_time)
-            if start_dt >= end_dt:
-                print("❌ Error: Start time must be earlier than end time.")
+            if not is_valid_time_range(start_time, end_time):
                 logging.warning("❌ Start time must be earlier than end time.")
                 continue  # Restart the loop if the validation fails
 
         except ValueError as e:
             # ✅ Handle invalid datetime inputs
-            print(f"❌ Invalid datetime format: {e}")
-            logging.error(f"❌ Invalid datetime format: {e}")
+            logging.error("❌ Invalid datetime format: %s", e)
             continue  # Restart the loop if the validation fails
 
         # ✅ Add the valid event to the list
-        events.append(
-            {"summary": summary, "start_time": start_time, "end_time": end_time}
-        )
+        events.append(build_event(summary, start_time, end_time, color_id))
 
-    # ✅ Loop through the list of unique events and create them in the calendar
-    for event in events:
-        try:
-            create_event(
-                calendar_name, event["summary"], event["start_time"], event["end_time"]
-            )
-        except Exception as e:
-            print(f"❌ Error creating event '{event['summary']}': {e}")
-            logging.error(f"❌ Error creating event '{event['summary']}': {e}")
+    # ✅ Create all the events in the calendar
+    added_count = insert_events(calendar_id, events)
 
     # ✅ Confirm successful addition of events
     print(
-        f"✅ {len(events)} unique event(s) added successfully to calendar '{calendar_name}'!"
+        f"✅ {added_count} unique event(s) added successfully to calendar '{calendar_name}'!"
     )
     logging.debug(
-        f"✅ {len(events)} unique events added to calendar '{calendar_name}'."
+        "✅ %s unique events added to calendar '%s'.", added_count, calendar_name
     )
 
 
-# ✅ Import Events from CSV
-def import_from_csv(calendar_name, csv_file):
+# ✅ Import Event Rows
+# Columns read from an import file's header row, in the order they are unpacked
+IMPORT_COLUMNS = ("Summary", "Start Date", "Start Time", "End Date", "End Time")
+
+
+def import_event_rows(calendar_name, headers, rows, row_label, confirm_skipped=None):
     """
-    Import events from a CSV file into a Google Calendar.
+    Validate imported rows and insert them into a Google Calendar in batches.
 
     Args:
         calendar_name (str): The name of the calendar to import events into.
-        csv_file (str): Path to the CSV file containing event data.
+        headers (list): The column names from the file's header row.
+        rows (iterable): Pairs of (line number, list of cell strings), one per data row.
+        row_label (str): How a row is named in messages (e.g., "CSV line").
+        confirm_skipped (callable, optional): Called as
+            `confirm_skipped(skipped_count, valid_count)` when some rows are invalid;
+            the import only goes ahead if it returns True. Without it, invalid rows
+            are skipped and the valid ones imported.
 
     Explanation:
-        - Reads a CSV file containing event data (Summary, Start Date, Start Time, End Date, End Time).
-        - Validates each row to ensure required fields are provided.
-        - Validates that start time is earlier than end time.
-        - Adds valid events to the calendar one by one.
+        - Shared by `import_from_csv` and `import_from_xlsx`, so both file types are
+          validated the same way and use the same batched inserts.
+        - The whole file is validated (including impossible dates such as February 30)
+          before anything is sent to Google Calendar, so a bad row can't leave the
+          file half imported. The valid rows are kept in memory until then.
     """
-    # ✅ Fetch the calendar ID based on the calendar name
+    # ✅ Resolve the header to column positions once, instead of per row
+    column_indices = [
+        headers.index(column) if column in headers else None
+        for column in IMPORT_COLUMNS
+    ]
+
+    # ✅ Validate every row before making any API call
+    valid_rows = []  # (line number, summary, start datetime, end datetime)
+    skipped_count = 0
+    for line_number, row in rows:
+        if not row:
+            continue  # Blank line
+
+        # ✅ Extract event details from the current row by column position;
+        # missing columns and short rows read as empty fields
+        summary, start_date, start_time, end_date, end_time = [
+            row[index].strip() if index is not None and index < len(row) else ""
+            for index in column_indices
+        ]
+
+        # ✅ Validate required fields
+        if not (summary and start_date and start_time and end_date and end_time):
+            logging.warning("❌ Skipping invalid row (missing fields): %s", row)
+            skipped_count += 1
+            continue
+
+        try:
+            # ✅ Create ISO 8601 formatted datetime strings
+            start_datetime = f"{start_date}T{start_time}"
+            end_datetime = f"{end_date}T{end_time}"
+
+            # ✅ Validate that start time is earlier than end time
+            if not is_valid_time_range(start_datetime, end_datetime):
+                logging.warning("❌ Skipping row with invalid time range: %s", row)
+                skipped_count += 1
+                continue
+
+        except ValueError as e:
+            # ✅ Handle invalid datetime formats
+            logging.error(
+                "❌ Skipping row with invalid datetime format: %s. Error: %s",
+                row,
+                e,
+            )
+            skipped_count += 1
+            continue
+
+        valid_rows.append((line_number, summary, start_datetime, end_datetime))
+
+    if not valid_rows:
+        logging.warning("❌ No valid events to import.")
+        return
+
+    # ✅ Let the caller stop the import if some rows would be left out
+    if (
+        skipped_count
+        and confirm_skipped is not None
+        and not confirm_skipped(skipped_count, len(valid_rows))
+    ):
+        logging.info("❌ Import cancelled, nothing was added.")
+        return
+
+    # ✅ Fetch the calendar ID based on the calendar name.
+    # This is the only calendarList request of the import: the color lookup below is
+    # served from the same cached response, and every insert depends only on these two.
     calendar_id = get_calendar_id(calendar_name)
     if not calendar_id:
-        logging.error(f"❌ Calendar '{calendar_name}' not found.")
-        print(f"❌ Calendar '{calendar_name}' not found!")
+        logging.error("❌ Calendar '%s' not found.", calendar_name)
         return
 
     # ✅ Retrieve the default color ID for the calendar
     color_id = get_calendar_color_id(calendar_name)
 
+    # ✅ Track the outcome of every insert as batch responses come back
+    added_count = 0
+    failed_count = 0
+
+    def on_insert(request_id, response, exception):
+        nonlocal added_count, failed_count
+        if exception is not None:
+            failed_count += 1
+            logging.error(
+                "❌ Failed to add event from %s %s: %s",
+                row_label,
+                request_id,
+                exception,
+            )
+            return
+
+        added_count += 1
+        # Per-event successes go to the log file only; the totals are shown at the end
+        start = response["start"].get("dateTime", response["start"].get("date"))
+        logging.debug("✅ Event added: %s on %s", response["summary"], start[:10])
+
+    def insert_requests():
+        for line_number, summary, start_datetime, end_datetime in valid_rows:
+            # ✅ Create the event payload to send to Google Calendar
+            event = build_event(summary, start_datetime, end_datetime, color_id)
+
+            # ✅ Queue the insert; the line number identifies it in the callback.
+            # Only the fields the success log reads are sent back
+            yield str(line_number), get_service().events().insert(
+                calendarId=calendar_id, body=event, fields="summary,start"
+            )
+
+    # ✅ Send the events to Google Calendar in batches instead of one request per row
+    execute_batch(insert_requests(), on_insert)
+
+    logging.info("📥 Import finished: %s added, %s failed.", added_count, failed_count)
+
+
+# ✅ Import Events from CSV
+CSV_READ_BUFFER_SIZE = 1 << 20  # 1 MiB read buffer for CSV imports
+
+
+def import_from_csv(calendar_name, csv_file, confirm_skipped=None):
+    """
+    Import events from a CSV file into a Google Calendar.
+
+    Args:
+        calendar_name (str): The name of the calendar to import events into.
+        csv_file (str): Path to the CSV file containing event data.
+        confirm_skipped (callable, optional): Asked whether to go ahead when some
+            rows are invalid (see `import_event_rows`).
+
+    Explanation:
+        - Reads a CSV file containing event data (Summary, Start Date, Start Time, End Date, End Time).
+        - Validates each row to ensure required fields are provided.
+        - Validates that start time is earlier than end time.
+        - Adds valid events to the calendar in batches.
+    """
     try:
         # ✅ Open the CSV file for reading
-        with open(csv_file, mode="r", newline="", encoding="utf-8") as file:
-            reader = csv.DictReader(file)  # Read CSV rows as dictionaries
+        # Rows are read through a large read buffer and kept only as their validated
+        # fields, and large files are read in few system calls.
+        # "utf-8-sig" drops the byte order mark Excel puts at the start of UTF-8 CSVs,
+        # which would otherwise end up in the first header name.
+        with open(
+            csv_file,
+            mode="r",
+            newline="",
+            encoding="utf-8-sig",
+            buffering=CSV_READ_BUFFER_SIZE,
+        ) as file:
+            # Rows are read as plain lists; the header is resolved to column positions once
+            reader = csv.reader(file)
+            headers = next(reader, None)
 
             # ✅ Ensure the CSV has valid headers
-            if not reader.fieldnames:
+            if not headers:
                 logging.error("❌ CSV file is empty or headers are missing.")
-                print("❌ CSV file is empty or headers are missing.")
                 return
 
-            logging.info(f"✅ CSV Headers: {reader.fieldnames}")
-            print("✅ CSV Headers:", reader.fieldnames)
-
-            # ✅ Iterate through each row in the CSV file
-            for row in reader:
-                # ✅ Extract event details from the current row
-                summary = row.get("Summary", "").strip()
-                start_date = row.get("Start Date", "").strip()
-                start_time = row.get("Start Time", "").strip()
-                end_date = row.get("End Date", "").strip()
-                end_time = row.get("End Time", "").strip()
-
-                # ✅ Validate required fields
-                if not all([summary, start_date, start_time, end_date, end_time]):
-                    logging.warning(f"❌ Skipping invalid row (missing fields): {row}")
-                    print(f"❌ Skipping invalid row (missing fields): {row}")
-                    continue
-
-                try:
-                    # ✅ Create ISO 8601 formatted datetime strings
-                    start_datetime = f"{start_date}T{start_time}"
-                    end_datetime = f"{end_date}T{end_time}"
-
-                    # ✅ Validate that start time is earlier than end time
-                    start_dt = datetime.fromisoformat(start_datetime)
-                    end_dt = datetime.fromisoformat(end_datetime)
-
-                    if start_dt >= end_dt:
-                        logging.warning(
-                            f"❌ Skipping row with invalid time range: {row}"
-                        )
-                        print(f"❌ Skipping row with invalid time range: {row}")
-                        continue
-
-                    # ✅ Create the event payload to send to Google Calendar
-                    event = {
-                        "summary": summary,
-                        "start": {
-                            "dateTime": start_datetime,
-                            "timeZone": DEFAULT_TIMEZONE,
-                        },
-                        "end": {"dateTime": end_datetime, "timeZone": DEFAULT_TIMEZONE},
-                        "colorId": color_id,
-                        "reminders": {
-                            "useDefault": False,
-                            "overrides": [
-                                {
-                                    "method": "email",
-                                    "minutes": 30,
-                                },  # Email reminder 30 minutes before
-                                {
-                                    "method": "popup",
-                                    "minutes": 10,
-                                },  # Popup reminder 10 minutes before
-                            ],
-                        },
-                    }
-
-                    # ✅ Add the event to Google Calendar
-                    created_event = (
-                        service.events()
-                        .insert(calendarId=calendar_id, body=event)
-                        .execute()
-                    )
-                    logging.info(f"✅ Event added: {summary} on {start_date}")
-                    print(f"✅ Event added: {summary} on {start_date}")
-
-                except ValueError as e:
-                    # ✅ Handle invalid datetime formats
-                    logging.error(
-                        f"❌ Skipping row with invalid datetime format: {row}. Error: {e}"
-                    )
-                    print(
-                        f"❌ Skipping row with invalid datetime format: {row}. Error: {e}"
-                    )
-                except KeyError as e:
-                    # ✅ Handle missing keys in the row
-                    logging.error(f"❌ Missing key in row: {row}. Error: {e}")
-                    print(f"❌ Missing key in row: {row}. Error: {e}")
+            logging.info("✅ CSV Headers: %s", headers)
+
+            # ✅ Validate the rows and add them to the calendar
+            import_event_rows(
+                calendar_name,
+                headers,
+                ((reader.line_num, row) for row in reader),
+                "CSV line",
+                confirm_skipped,
+            )
 
     except FileNotFoundError:
         # ✅ Handle if the CSV file doesn't exist
         logging.error("❌ CSV file not found. Please provide a valid path.")
-        print("❌ CSV file not found. Please provide a valid path.")
     except Exception as e:
         # ✅ Handle any other unexpected errors
-        logging.error(f"❌ Error processing CSV: {e}")
-        print(f"❌ Error processing CSV: {e}")
+        logging.error("❌ Error processing CSV: %s", e)
+
+
+# ✅ Import Events from XLSX
+def xlsx_cell_text(value):
+    """
+    Convert an XLSX cell value to the text a CSV file would hold.
+
+    Args:
+        value: The cell value as read by openpyxl (str, number, date, time, or None).
+
+    Returns:
+        str: The value as text; date cells become "YYYY-MM-DD" and time cells "HH:MM:SS".
+    """
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.date().isoformat()  # Date-formatted cells are read as datetimes
+    if hasattr(value, "isoformat"):
+        return value.isoformat()  # date and time cells
+    return str(value)
+
+
+def import_from_xlsx(calendar_name, xlsx_file, confirm_skipped=None):
+    """
+    Import events from the first worksheet of an XLSX file into a Google Calendar.
+
+    Args:
+        calendar_name (str): The name of the calendar to import events into.
+        xlsx_file (str): Path to the XLSX file containing event data.
+        confirm_skipped (callable, optional): Asked whether to go ahead when some
+            rows are invalid (see `import_event_rows`).
+
+    Explanation:
+        - The worksheet uses the same columns as the CSV import
+          (Summary, Start Date, Start Time, End Date, End Time).
+        - The workbook is opened in read-only mode and rows are read as plain values,
+          so cells are streamed without building a cell object for each one.
+        - Rows are validated and inserted exactly like CSV rows.
+    """
+    try:
+        import openpyxl  # Only needed for XLSX imports
+    except ImportError:
+        logging.error(
+            "❌ Importing XLSX files requires openpyxl (pip install openpyxl)."
+        )
+        return
+
+    try:
+        workbook = openpyxl.load_workbook(xlsx_file, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            headers = next(rows, None)
+
+            # ✅ Ensure the worksheet has valid headers
+            if not headers or not any(headers):
+                logging.error("❌ XLSX file is empty or headers are missing.")
+                return
+
+            headers = [xlsx_cell_text(value) for value in headers]
+            logging.info("✅ XLSX Headers: %s", headers)
+
+            # ✅ Validate the rows and add them to the calendar; empty rows are skipped
+            import_event_rows(
+                calendar_name,
+                headers,
+                (
+                    (row_number, [xlsx_cell_text(value) for value in row])
+                    for row_number, row in enumerate(rows, start=2)
+                    if any(value is not None for value in row)
+                ),
+                "XLSX row",
+                confirm_skipped,
+            )
+        finally:
+            workbook.close()  # Read-only workbooks keep the file open until closed
+
+    except FileNotFoundError:
+        # ✅ Handle if the XLSX file doesn't exist
+        logging.error("❌ XLSX file not found. Please provide a valid path.")
+    except Exception as e:
+        # ✅ Handle any other unexpected errors
+        logging.error("❌ Error processing XLSX: %s", e)
+
+
+# ✅ Import Events from a File
+def import_from_file(calendar_name, path, confirm_skipped=None):
+    """
+    Import events from a CSV or XLSX file, chosen by the file extension.
+
+    Args:
+        calendar_name (str): The name of the calendar to import events into.
+        path (str): Path to a .csv or .xlsx file.
+        confirm_skipped (callable, optional): Asked whether to go ahead when some
+            rows are invalid (see `import_event_rows`).
+    """
+    if path.lower().endswith(".xlsx"):
+        import_from_xlsx(calendar_name, path, confirm_skipped)
+    else:
+        import_from_csv(calendar_name, path, confirm_skipped)
 
 
 # ✅ Add Event Using a Template
@@ -716,24 +1624,21 @@ def add_event_using_template(calendar_name):
     # ✅ Fetch the calendar ID based on the calendar name
     calendar_id = get_calendar_id(calendar_name)
     if not calendar_id:
-        logging.error(f"❌ Calendar '{calendar_name}' not found.")
-        print(f"❌ Calendar '{calendar_name}' not found!")
+        logging.error("❌ Calendar '%s' not found.", calendar_name)
         return
 
     # ✅ Display a list of available event templates
     print("\n📝 Available Event Templates:")
-    for idx, template_name in enumerate(event_templates.keys(), start=1):
+    for idx, template_name in enumerate(TEMPLATE_KEYS, start=1):
         print(f"{idx}. {template_name}")
 
     # ✅ Prompt the user to select a template by number
     choice = input("Select a template by number: ").strip()
     try:
         template_index = int(choice) - 1
-        template_keys = list(event_templates.keys())
-        selected_template = template_keys[template_index]
+        selected_template = TEMPLATE_KEYS[template_index]
     except (ValueError, IndexError):
         logging.warning("❌ Invalid choice! Please select a valid template.")
-        print("❌ Invalid choice! Please select a valid template.")
         return
 
     # ✅ Fetch template details
@@ -743,34 +1648,52 @@ def add_event_using_template(calendar_name):
         "duration", 60
     )  # Default to 60 minutes if duration isn't provided
 
+    # ✅ A positive duration guarantees the end time comes after the start time
+    if isinstance(duration, bool) or not isinstance(duration, (int, float)):
+        logging.error("❌ Template '%s' has an invalid duration.", selected_template)
+        return
+    if duration <= 0:
+        logging.error(
+            "❌ Template '%s' must have a duration above 0 minutes.", selected_template
+        )
+        return
+
     # ✅ Prompt for event start date and time
-    start_time = prompt_for_datetime("Enter event start date and time")
+    # prompt_for_datetime already returns a valid ISO 8601 string
+    start_time_str = prompt_for_datetime("Enter event start date and time")
     try:
-        start_dt = datetime.fromisoformat(start_time)
-        end_dt = start_dt + timedelta(
+        end_dt = datetime.fromisoformat(start_time_str) + timedelta(
             minutes=duration
         )  # Calculate end time based on duration
-
-        start_time_str = start_dt.isoformat()
         end_time_str = end_dt.isoformat()
-    except ValueError as e:
-        logging.error(f"❌ Invalid datetime input: {e}")
-        print(f"❌ Invalid datetime input: {e}")
+    except (ValueError, OverflowError) as e:
+        logging.error("❌ Invalid datetime input: %s", e)
         return
 
-    # ✅ Create the event in the calendar
+    # ✅ Create the event in the calendar, reusing the calendar ID looked up above
     try:
-        create_event(calendar_name, summary, start_time_str, end_time_str)
-        logging.info(
-            f"✅ Event '{summary}' added using template '{selected_template}'."
-        )
-        print(f"✅ Event '{summary}' added using template '{selected_template}'.")
+        if insert_event(
+            calendar_id,
+            calendar_name,
+            summary,
+            start_time_str,
+            end_time_str,
+            validate=False,  # Valid by construction (see the duration check above)
+        ):
+            logging.info(
+                "✅ Event '%s' added using template '%s'.", summary, selected_template
+            )
     except Exception as e:
-        logging.error(f"❌ Failed to create event: {e}")
-        print(f"❌ Failed to create event: {e}")
+        logging.error("❌ Failed to create event: %s", e)
 
 
 # ✅ Add Recurring Event
+# Strips the dashes from an ISO date for an RRULE UNTIL value
+DATE_DASHES = str.maketrans("", "", "-")
+# A positive number of occurrences, in ASCII digits only
+COUNT_RE = re.compile(r"[1-9][0-9]{0,4}")
+
+
 def add_recurring_event(calendar_name):
     """
     Add a recurring event to a specific calendar.
@@ -788,8 +1711,7 @@ def add_recurring_event(calendar_name):
     # This ensures we are adding the event to the correct calendar
     calendar_id = get_calendar_id(calendar_name)
     if not calendar_id:
-        logging.error(f"❌ Calendar '{calendar_name}' not found.")  # Log the error
-        print(f"❌ Calendar '{calendar_name}' not found!")  # Show an error to the user
+        logging.error("❌ Calendar '%s' not found.", calendar_name)  # Log the error
         return
 
     # ✅ Gather basic event details from the user
@@ -800,20 +1722,14 @@ def add_recurring_event(calendar_name):
     try:
         # ✅ Validate the datetime inputs
         # Ensure the start time is earlier than the end time
-        start_dt = datetime.fromisoformat(start_time)
-        end_dt = datetime.fromisoformat(end_time)
-        if start_dt >= end_dt:
+        if not is_valid_time_range(start_time, end_time):
             logging.warning(
                 "❌ Start time must be earlier than end time."
             )  # Log warning
-            print(
-                "❌ Error: Start time must be earlier than end time."
-            )  # Show an error to the user
             return
     except ValueError as e:
         # Handle invalid datetime formats entered by the user
-        logging.error(f"❌ Invalid datetime format: {e}")
-        print(f"❌ Invalid datetime format: {e}")
+        logging.error("❌ Invalid datetime format: %s", e)
         return
 
     # ✅ Ask the user for a recurrence pattern (Daily, Weekly, Monthly, Yearly)
@@ -831,7 +1747,6 @@ def add_recurring_event(calendar_name):
     if not frequency:
         # Handle invalid recurrence choice
         logging.warning("❌ Invalid recurrence choice.")  # Log the error
-        print("❌ Invalid recurrence choice.")  # Show an error to the user
         return
 
     # ✅ Ask the user how the recurrence should end: by a date or a number of occurrences
@@ -846,67 +1761,56 @@ def add_recurring_event(calendar_name):
     if end_condition == "d":
         # ✅ End recurrence by a specific date
         end_date = input("Enter end date (YYYY-MM-DD): ").strip()
+        try:
+            # ✅ Reject impossible dates (e.g., February 30) before building the RRULE
+            until = date.fromisoformat(end_date)
+        except ValueError:
+            logging.warning("❌ Invalid end date. Use the YYYY-MM-DD format.")
+            return
+        # The parsed date is formatted again, so the UNTIL value is always YYYYMMDD
         recurrence_rule = (
-            f"RRULE:FREQ={frequency};UNTIL={end_date.replace('-', '')}T000000Z"
+            f"RRULE:FREQ={frequency};UNTIL={until.isoformat().translate(DATE_DASHES)}"
+            "T000000Z"
         )
     elif end_condition == "n":
         # ✅ End recurrence after a specific number of occurrences
         count = input("Enter the number of occurrences: ").strip()
-        if not count.isdigit():
+        if not COUNT_RE.fullmatch(count):
             logging.warning("❌ Invalid number of occurrences.")  # Log warning
-            print("❌ Invalid number of occurrences.")  # Show an error
             return
         recurrence_rule = f"RRULE:FREQ={frequency};COUNT={count}"
     else:
         # Handle invalid end condition choice
         logging.warning("❌ Invalid end condition choice.")  # Log the error
-        print("❌ Invalid end condition choice.")  # Show an error
         return
 
     # ✅ Build the recurring event payload
-    event = {
-        "summary": summary,  # Title or description of the event
-        "start": {
-            "dateTime": start_time,
-            "timeZone": DEFAULT_TIMEZONE,
-        },  # Event start time
-        "end": {"dateTime": end_time, "timeZone": DEFAULT_TIMEZONE},  # Event end time
-        "recurrence": [
-            recurrence_rule
-        ],  # Add the recurrence rule (Daily, Weekly, etc.)
-        "reminders": {
-            "useDefault": False,
-            "overrides": [
-                {
-                    "method": "email",
-                    "minutes": 30,
-                },  # Email reminder 30 minutes before event
-                {
-                    "method": "popup",
-                    "minutes": 10,
-                },  # Popup reminder 10 minutes before event
-            ],
-        },
-    }
+    event = build_event(summary, start_time, end_time)
+    event["recurrence"] = [
+        recurrence_rule
+    ]  # Add the recurrence rule (Daily, Weekly, etc.)
 
     # ✅ Send the event data to Google Calendar API to create the recurring event
     try:
         created_event = (
-            service.events().insert(calendarId=calendar_id, body=event).execute()
+            get_service()
+            .events()
+            .insert(calendarId=calendar_id, body=event, fields=CREATED_EVENT_FIELDS)
+            .execute(num_retries=API_NUM_RETRIES)
         )
         logging.info(
-            f"✅ Recurring event created: {created_event['htmlLink']}"
+            "✅ Recurring event created: %s", created_event["htmlLink"]
         )  # Log success
-        print(
-            f"✅ Recurring event created: {created_event['htmlLink']}"
-        )  # Show success to the user
     except Exception as e:
         # Handle errors during event creation
-        logging.error(f"❌ Error creating recurring event: {e}")
-        print(f"❌ Error creating recurring event: {e}")
+        logging.error("❌ Error creating recurring event: %s", e)
 
 
 # ✅ Search Events
+# Partial response: only the fields search_events displays and update_event reads
+SEARCH_EVENT_FIELDS = "items(id,summary,start(date,dateTime))"
+
+
 def search_events(calendar_name):
     """
     Search events in a calendar by keyword or date range.
@@ -925,9 +1829,8 @@ def search_events(calendar_name):
     calendar_id = get_calendar_id(calendar_name)
     if not calendar_id:
         logging.error(
-            f"❌ Calendar '{calendar_name}' not found."
+            "❌ Calendar '%s' not found.", calendar_name
         )  # Log an error if calendar not found
-        print(f"❌ Calendar '{calendar_name}' not found!")  # Show an error to the user
         return
 
     # ✅ Present search options to the user
@@ -953,15 +1856,14 @@ def search_events(calendar_name):
     else:
         # ✅ Handle invalid search choice
         logging.warning("❌ Invalid choice.")  # Log a warning for an invalid choice
-        print("❌ Invalid choice.")  # Show an error message to the user
         return
 
     try:
         # ✅ Fetch events from Google Calendar API based on search criteria
-        events_result = (
-            service.events()
-            .list(
-                calendarId=calendar_id,  # Search within the selected calendar
+        events = list(
+            iter_events(
+                calendar_id,  # Search within the selected calendar
+                SEARCH_EVENT_FIELDS,  # Only what search and update read
                 q=search_query,  # Filter by keyword if provided
                 timeMin=(
                     f"{time_min}T00:00:00Z" if time_min else None
@@ -972,33 +1874,29 @@ def search_events(calendar_name):
                 singleEvents=True,  # Ensures recurring events are expanded into single instances
                 orderBy="startTime",  # Sort events by their start time
             )
-            .execute()
         )
 
-        # ✅ Retrieve the list of events from the API response
-        events = events_result.get("items", [])
         if not events:
             # ✅ Handle case where no events match the criteria
             logging.info("❌ No matching events found.")  # Log info for no results
-            print("❌ No matching events found.")  # Inform the user
             return
 
-        # ✅ Display matching events to the user
-        print("\n🔗 Matching Events:")
+        # ✅ Display matching events to the user, written out in a single call
+        lines = ["\n🔗 Matching Events:"]
         for i, event in enumerate(events, start=1):
             # ✅ Get the event's start time (dateTime or date if it's an all-day event)
             start = event["start"].get("dateTime", event["start"].get("date"))
-            print(f"{i}. {event['summary']} | Start: {start} | ID: {event['id']}")
+            lines.append(
+                f"{i}. {event['summary']} | Start: {start} | ID: {event['id']}"
+            )
+        print("\n".join(lines))
 
         # ✅ Return the list of events for further processing, if needed
         return events
 
     except Exception as e:
         # ✅ Handle unexpected errors during the event search
-        logging.error(f"❌ Error searching events: {e}")  # Log the exception
-        print(
-            f"❌ Error searching events: {e}"
-        )  # Display the error message to the user
+        logging.error("❌ Error searching events: %s", e)  # Log the exception
 
 
 # ✅ Update Event
@@ -1014,15 +1912,15 @@ def update_event(calendar_name):
         - The user selects an event by its number from the search results.
         - The user can update the event's summary, start time, end time, and description.
         - If no updates are provided, the existing values are retained.
+        - Only the changed fields are sent, using `events().patch()`.
     """
     # ✅ Step 1: Fetch the calendar ID using the calendar name
     # The calendar ID is needed to identify and modify events in the correct calendar.
     calendar_id = get_calendar_id(calendar_name)
     if not calendar_id:
         logging.error(
-            f"❌ Calendar '{calendar_name}' not found!"
+            "❌ Calendar '%s' not found!", calendar_name
         )  # Log an error if calendar is not found
-        print(f"❌ Calendar '{calendar_name}' not found!")  # Inform the user
         return
 
     # ✅ Step 2: Search for events in the selected calendar
@@ -1041,7 +1939,6 @@ def update_event(calendar_name):
         logging.warning(
             "❌ Invalid event selection."
         )  # Log a warning for invalid selection
-        print("❌ Invalid event selection.")  # Show an error to the user
         return
 
     # ✅ Step 4: Retrieve the selected event details
@@ -1056,63 +1953,57 @@ def update_event(calendar_name):
         f"New summary (leave blank to keep '{selected_event['summary']}'): "
     ).strip()
     start_time = prompt_for_datetime(
-        "Enter new start date and time (leave blank to keep current)"
+        "Enter new start date and time (leave the year blank to keep current)",
+        allow_blank=True,
     )
     end_time = prompt_for_datetime(
-        "Enter new end date and time (leave blank to keep current)"
+        "Enter new end date and time (leave the year blank to keep current)",
+        allow_blank=True,
     )
     description = input("Enter new description (leave blank to keep current): ").strip()
 
-    # ✅ Step 6: Build the updated event data structure
-    updated_event = {
-        "summary": summary
-        or selected_event["summary"],  # Keep the current summary if none is provided
-        "start": selected_event["start"],  # Default to the current start time
-        "end": selected_event["end"],  # Default to the current end time
-        "description": description
-        or selected_event.get("description", ""),  # Update description if provided
-    }
-
-    # ✅ Step 7: Update start and end times if the user provided new ones
+    # ✅ Step 6: Collect only the fields the user changed
+    # `patch` leaves every field that isn't sent untouched
+    patch_body = {}
+    if summary:
+        patch_body["summary"] = summary
     if start_time:
-        updated_event["start"] = {"dateTime": start_time, "timeZone": DEFAULT_TIMEZONE}
+        patch_body["start"] = {"dateTime": start_time, "timeZone": DEFAULT_TIMEZONE}
     if end_time:
-        updated_event["end"] = {"dateTime": end_time, "timeZone": DEFAULT_TIMEZONE}
+        patch_body["end"] = {"dateTime": end_time, "timeZone": DEFAULT_TIMEZONE}
+    if description:
+        patch_body["description"] = description
 
-    # ✅ Step 8: Validate the time range if both start and end times are updated
+    if not patch_body:
+        logging.info("ℹ️ No changes entered, event left as is.")
+        return
+
+    # ✅ Step 7: Validate the time range if both start and end times are updated
     try:
         if start_time and end_time:
-            start_dt = datetime.fromisoformat(start_time)  # Parse start time
-            end_dt = datetime.fromisoformat(end_time)  # Parse end time
-            if start_dt >= end_dt:
+            if not is_valid_time_range(start_time, end_time):
                 logging.error(
                     "❌ Error: Start time must be earlier than end time."
                 )  # Log the error
-                print(
-                    "❌ Error: Start time must be earlier than end time."
-                )  # Inform the user
                 return
     except ValueError as e:
         # ✅ Handle invalid datetime formats
-        logging.error(f"❌ Invalid datetime format: {e}")
-        print(f"❌ Invalid datetime format: {e}")
+        logging.error("❌ Invalid datetime format: %s", e)
         return
 
-    # ✅ Step 9: Send the updated event details to Google Calendar API
+    # ✅ Step 8: Send only the changed fields to Google Calendar API
     try:
-        service.events().update(
+        get_service().events().patch(
             calendarId=calendar_id,  # Use the fetched calendar ID
             eventId=event_id,  # Specify the event to update using its ID
-            body=updated_event,  # Pass the updated event details
-        ).execute()
+            body=patch_body,  # Pass only the changed event details
+        ).execute(num_retries=API_NUM_RETRIES)
 
         logging.info("✅ Event updated successfully.")  # Log success message
-        print("✅ Event updated successfully.")  # Inform the user
 
     except Exception as e:
         # ✅ Handle errors during the event update process
-        logging.error(f"❌ Error updating event: {e}")  # Log the error
-        print(f"❌ Error updating event: {e}")  # Display the error to the user
+        logging.error("❌ Error updating event: %s", e)  # Log the error
 
 
 # ✅ Get Calendar Color ID
@@ -1125,32 +2016,30 @@ def get_calendar_color_id(calendar_name):
 
     Explanation:
         - Each Google Calendar can have a default color assigned to it.
-        - This function fetches the `colorId` for the given calendar.
+        - This function reads the `colorId` from the cached calendar list, so callers that
+          already resolved the calendar ID (e.g. `import_from_csv`) make no extra API call.
         - If no color is assigned, it defaults to "1".
     """
     try:
-        # ✅ Step 1: Fetch all calendars associated with the user account
-        calendars_list = service.calendarList().list().execute()
-
-        # ✅ Step 2: Loop through all calendars to find the matching calendar by name
-        for calendar in calendars_list["items"]:
-            if calendar["summary"] == calendar_name:
-                # ✅ Step 3: Retrieve the `colorId` from the calendar
-                # If no color is set, default to "1"
-                color_id = calendar.get("colorId", "1")
-                logging.info(
-                    f"🎨 Retrieved colorId '{color_id}' for calendar '{calendar_name}'."
-                )
-                return color_id  # Return the found colorId
+        # ✅ Step 1: Look up the calendar in the cached calendar list
+        calendar = get_calendar_entries().get(calendar_name)
+
+        if calendar is not None:
+            # ✅ Step 2: Retrieve the `colorId` from the calendar
+            # If no color is set, default to "1"
+            color_id = calendar.get("colorId", "1")
+            logging.info(
+                "🎨 Retrieved colorId '%s' for calendar '%s'.", color_id, calendar_name
+            )
+            return color_id  # Return the found colorId
 
     except Exception as e:
-        # ✅ Step 4: Handle any errors during the API call
+        # ✅ Step 3: Handle any errors during the API call
         logging.error(
-            f"❌ Failed to retrieve calendar color for '{calendar_name}': {e}"
+            "❌ Failed to retrieve calendar color for '%s': %s", calendar_name, e
         )
-        print(f"❌ Failed to retrieve calendar color for '{calendar_name}': {e}")
 
-    # ✅ Step 5: If the calendar isn't found or an error occurs, return the default color "1"
+    # ✅ Step 4: If the calendar isn't found or an error occurs, return the default color "1"
     return "1"
 
 
@@ -1166,62 +2055,72 @@ def sync_event_colors(calendar_name):
         - Fetches all events from the specified calendar.
         - Compares each event's color with the calendar's default color.
         - If an event's color does not match, it updates the event to use the calendar's default color.
+        - Color updates are sent as batched `patch` requests carrying only the new `colorId`.
     """
     # ✅ Step 1: Get the calendar ID for the specified calendar name
     calendar_id = get_calendar_id(calendar_name)
     if not calendar_id:
-        logging.error(f"❌ Calendar '{calendar_name}' not found!")
-        print(f"❌ Calendar '{calendar_name}' not found!")
+        logging.error("❌ Calendar '%s' not found!", calendar_name)
         return
 
     # ✅ Step 2: Fetch the calendar's designated color from the configuration
-    # `calendars` and `color_map` are predefined mappings in the environment variables
-    color_hex = calendars.get(
-        calendar_name, "#236192"
-    )  # Default to `#236192` if not in .env
-    color_id = color_map.get(
-        color_hex, "1"
-    )  # Map the hex color to a Google Calendar `colorId`, defaulting to "1"
-
-    try:
-        # ✅ Step 3: Fetch all events from the calendar
-        events_result = service.events().list(calendarId=calendar_id).execute()
-        events = events_result.get(
-            "items", []
-        )  # Extract the list of events from the response
+    # `calendar_color_ids` is precomputed from the `calendars` and `color_map` env mappings
+    color_id = calendar_color_ids.get(calendar_name, DEFAULT_EVENT_COLOR_ID)
+
+    updated_count = 0  # Counter to track how many events were updated
+    event_summaries = {}  # Event ID -> title, for reporting batch results
+
+    def on_patch(request_id, response, exception):
+        nonlocal updated_count
+        if exception is not None:
+            logging.error(
+                "❌ Failed to update color for event '%s': %s",
+                event_summaries[request_id],
+                exception,
+            )
+            return
 
-        updated_count = 0  # Counter to track how many events were updated
+        # Per-event updates go to the log file only; the total is shown at the end
+        logging.debug("✅ Updated color for event: %s", event_summaries[request_id])
+        updated_count += 1  # Increment the updated event counter
 
+    def patch_requests(events):
         # ✅ Step 4: Loop through each event in the calendar
         for event in events:
             event_id = event.get("id")  # Unique identifier for the event
-            event_summary = event.get(
-                "summary", "No Summary"
-            )  # Event title, fallback to 'No Summary'
             event_color_id = event.get(
                 "colorId", None
             )  # Current event colorId, if available
 
             # ✅ Step 5: Check if the event color matches the calendar's default color
             if event_color_id != color_id:
-                # Update the event's color to match the calendar's default color
-                event["colorId"] = color_id
-                service.events().update(
-                    calendarId=calendar_id, eventId=event_id, body=event
-                ).execute()
+                # Event title, fallback to 'No Summary'
+                event_summaries[event_id] = event.get("summary", "No Summary")
+
+                # Patch only the color so the rest of the event is not sent, and ask
+                # for just the ID back since the callback doesn't read the response
+                yield event_id, get_service().events().patch(
+                    calendarId=calendar_id,
+                    eventId=event_id,
+                    body={"colorId": color_id},
+                    fields="id",
+                )
 
-                logging.info(f"✅ Updated color for event: {event_summary}")
-                print(f"✅ Updated color for event: {event_summary}")
-                updated_count += 1  # Increment the updated event counter
+    try:
+        # ✅ Step 3: Fetch all events from the calendar
+        # Pages are streamed, so updates start before the last page is downloaded
+        events = iter_events(calendar_id, "items(id,summary,colorId)")
+
+        # ✅ Send the color updates in batches instead of one request per event
+        # Setting a colorId twice is harmless, so lost responses can be resent
+        execute_batch(patch_requests(events), on_patch, idempotent=True)
 
         # ✅ Step 6: Display a summary of the changes
-        logging.info(f"🎨 Finished syncing colors. {updated_count} events updated.")
-        print(f"🎨 Finished syncing colors. {updated_count} events updated.")
+        logging.info("🎨 Finished syncing colors. %s events updated.", updated_count)
 
     except Exception as e:
         # ✅ Step 7: Handle errors gracefully
-        logging.error(f"❌ Error syncing event colors: {e}")
-        print(f"❌ Error syncing event colors: {e}")
+        logging.error("❌ Error syncing event colors: %s", e)
 
 
 # ✅ Inspect Calendar Color
@@ -1235,19 +2134,20 @@ def inspect_calendar_color(calendar_name):
     Explanation:
         - Each Google Calendar can have a specific `colorId`.
         - This function retrieves and displays the `colorId` of the given calendar.
+        - The `colorId` comes from the cached calendar list, so no extra API call is made.
         - If the calendar isn't found or an error occurs, it handles the issue gracefully.
     """
     # ✅ Step 1: Get the calendar ID using its name
     calendar_id = get_calendar_id(calendar_name)
     if not calendar_id:
         # Log and print an error if the calendar doesn't exist
-        logging.error(f"❌ Calendar '{calendar_name}' not found!")
-        print(f"❌ Calendar '{calendar_name}' not found!")
+        logging.error("❌ Calendar '%s' not found!", calendar_name)
         return
 
     try:
-        # ✅ Step 2: Fetch calendar details from Google Calendar API
-        calendar = service.calendarList().get(calendarId=calendar_id).execute()
+        # ✅ Step 2: Read the calendar details from the cached calendar list
+        # `get_calendar_id` just loaded this entry, so no second request is needed
+        calendar = get_calendar_entries().get(calendar_name, {})
 
         # ✅ Step 3: Extract the colorId from the calendar details
         color_id = calendar.get(
@@ -1255,16 +2155,59 @@ def inspect_calendar_color(calendar_name):
         )  # Default to "Default" if not present
 
         # ✅ Step 4: Display the retrieved colorId
-        logging.info(f"🎨 Calendar '{calendar_name}' has colorId: {color_id}")
-        print(f"🎨 Calendar '{calendar_name}' has colorId: {color_id}")
+        logging.info("🎨 Calendar '%s' has colorId: %s", calendar_name, color_id)
 
     except Exception as e:
         # ✅ Step 5: Handle any errors during API interaction
-        logging.error(f"❌ Failed to retrieve calendar color: {e}")
-        print(f"❌ Failed to retrieve calendar color: {e}")
+        logging.error("❌ Failed to retrieve calendar color: %s", e)
 
 
 # ✅ Main Menu
+# The menu is printed with a single write each time it is shown
+MENU_BANNER = """
+🗓️  Google Calendar Manager
+1️⃣  List Calendars
+2️⃣  Create Calendar
+3️⃣  Add Event with Multiple Dates/Times
+4️⃣  Add Multiple Unique Events
+5️⃣  Import Bulk Events from CSV/XLSX
+6️⃣  Sync Event Colors with Calendar Color
+7️⃣  Inspect Calendar Color
+8️⃣  Add Event from Template
+9️⃣  Add Recurring Event
+🔟  Search Events
+1️⃣1️⃣  Update Event
+🛑  Type 'exit' to quit."""
+
+
+def ask_calendar_name():
+    """
+    Prompt the user for the name of the calendar a menu option should work on.
+
+    Returns:
+        str: The calendar name, with surrounding whitespace removed.
+    """
+    return input("Enter calendar name: ").strip()
+
+
+def confirm_import_with_skipped_rows(skipped_count, valid_count):
+    """
+    Ask the user whether to import a file that has some invalid rows.
+
+    Args:
+        skipped_count (int): The number of rows that failed validation.
+        valid_count (int): The number of rows that would be imported.
+
+    Returns:
+        bool: True if the user wants to import the valid rows anyway.
+    """
+    answer = input(
+        f"{skipped_count} invalid row(s) will be skipped. "
+        f"Import the other {valid_count} events? (y/n): "
+    )
+    return answer.strip().lower() == "y"
+
+
 def main():
     """
     Main menu for the script.
@@ -1278,54 +2221,33 @@ def main():
     # ✅ Step 1: Define menu options and their corresponding functions
     menu_options = {
         "1": list_calendars,  # List all calendars
-        "2": lambda: create_calendar(
-            input("Enter calendar name: ").strip()
-        ),  # Create a new calendar
+        "2": lambda: create_calendar(ask_calendar_name()),  # Create a new calendar
         "3": lambda: add_event_with_multiple_dates(
-            input("Enter calendar name: ").strip()
+            ask_calendar_name()
         ),  # Add events with multiple dates
         "4": lambda: add_multiple_unique_events(
-            input("Enter calendar name: ").strip()
+            ask_calendar_name()
         ),  # Add multiple unique events
-        "5": lambda: import_from_csv(
-            input("Enter calendar name: ").strip(),
-            input("Enter the path to the CSV file: ").strip(),
-        ),  # Import events from a CSV file
-        "6": lambda: sync_event_colors(
-            input("Enter calendar name: ").strip()
-        ),  # Sync event colors
+        "5": lambda: import_from_file(
+            ask_calendar_name(),
+            input("Enter the path to the CSV or XLSX file: ").strip(),
+            confirm_import_with_skipped_rows,  # Let the user fix a file with bad rows
+        ),  # Import events from a CSV or XLSX file
+        "6": lambda: sync_event_colors(ask_calendar_name()),  # Sync event colors
         "7": lambda: inspect_calendar_color(
-            input("Enter calendar name: ").strip()
+            ask_calendar_name()
         ),  # Inspect calendar color
         "8": lambda: add_event_using_template(
-            input("Enter calendar name: ").strip()
+            ask_calendar_name()
         ),  # Add event using a template
-        "9": lambda: add_recurring_event(
-            input("Enter calendar name: ").strip()
-        ),  # Add a recurring event
-        "10": lambda: search_events(
-            input("Enter calendar name: ").strip()
-        ),  # Search events
-        "11": lambda: update_event(
-            input("Enter calendar name: ").strip()
-        ),  # Update an event
+        "9": lambda: add_recurring_event(ask_calendar_name()),  # Add a recurring event
+        "10": lambda: search_events(ask_calendar_name()),  # Search events
+        "11": lambda: update_event(ask_calendar_name()),  # Update an event
     }
 
     # ✅ Step 2: Display the menu options and handle user input
     while True:
-        print("\n🗓️  Google Calendar Manager")
-        print("1️⃣  List Calendars")
-        print("2️⃣  Create Calendar")
-        print("3️⃣  Add Event with Multiple Dates/Times")
-        print("4️⃣  Add Multiple Unique Events")
-        print("5️⃣  Import Bulk Events from CSV")
-        print("6️⃣  Sync Event Colors with Calendar Color")
-        print("7️⃣  Inspect Calendar Color")
-        print("8️⃣  Add Event from Template")
-        print("9️⃣  Add Recurring Event")
-        print("🔟  Search Events")
-        print("1️⃣1️⃣  Update Event")
-        print("🛑  Type 'exit' to quit.")
+        print(MENU_BANNER)
 
         # ✅ Step 3: Get the user's choice
         choice = input("👉 Enter your choice: ").strip().lower()
@@ -1334,7 +2256,6 @@ def main():
         if choice == "exit":
             # Exit gracefully
             logging.info("👋 Exiting Google Calendar Manager.")
-            print("👋 Goodbye!")
             break
         elif choice in menu_options:
             # ✅ Step 5: Execute the chosen menu option
@@ -1343,13 +2264,11 @@ def main():
             except Exception as e:
                 # Log and print any errors that occur while running the selected function
                 logging.error(
-                    f"❌ An error occurred while executing option {choice}: {e}"
+                    "❌ An error occurred while executing option %s: %s", choice, e
                 )
-                print(f"❌ An error occurred: {e}")
         else:
             # Handle invalid input
             logging.warning("❌ Invalid choice. Please try again.")
-            print("❌ Invalid choice! Please try again.")
 
 
 # ✅ Run the Script
@@ -1366,9 +2285,8 @@ if __name__ == "__main__":
         main()
     except KeyboardInterrupt:
         # ✅ Handle user interruption (Ctrl+C)
+        print()  # End the interrupted input line
         logging.warning("🛑 Program interrupted by user.")
-        print("\n🛑 Program interrupted by user.")
     except Exception as e:
         # ✅ Handle unexpected critical errors
-        logging.critical(f"❌ Critical error occurred: {e}")
-        print(f"❌ Critical error occurred: {e}")
+        logging.critical("❌ Critical error occurred: %s", e)
@@ -1,30 +1,80 @@
+import argparse
 import csv
+import sys
+from datetime import datetime
+
+def prompt_for_number(prompt, lowest, highest):
+    """Ask for a whole number in lowest..highest until a valid one is entered."""
+    while True:
+        text = input(prompt).strip()
+        if text.isascii() and text.isdigit() and lowest <= int(text) <= highest:
+            return int(text)
+        print(f"  Please enter a number from {lowest} to {highest}.")
 
 def prompt_for_event():
-    """Prompt the user to input event details."""
+    """Prompt the user to input event details.
+
+    Each date and time field is checked as it is entered and asked for again if it
+    is invalid (e.g., February 30, or an end time before the start time).
+
+    Returns a (summary, start_date, end_date) row, in the order of the CSV headers.
+    """
     print("Enter details for the event:")
     summary = input("  Event summary (e.g., Twins vs Yankees): ")
-    year = input("  Start date - Year (e.g., 2024): ")
-    month = input("  Start date - Month (1-12): ")
-    day = input("  Start date - Day (1-31): ")
-    start_hour = input("  Start time - Hour (0-23): ")
-    start_minute = input("  Start time - Minute (0-59): ")
-
-    end_hour = input("  End time - Hour (0-23): ")
-    end_minute = input("  End time - Minute (0-59): ")
-
-    # Construct the ISO 8601 datetime strings
-    start_date = f"{year}-{month.zfill(2)}-{day.zfill(2)}T{start_hour.zfill(2)}:{start_minute.zfill(2)}:00"
-    end_date = f"{year}-{month.zfill(2)}-{day.zfill(2)}T{end_hour.zfill(2)}:{end_minute.zfill(2)}:00"
-
-    return {
-        "summary": summary,
-        "start_date": start_date,
-        "end_date": end_date
-    }
-
-def create_csv(csv_file):
-    """Create a CSV file for bulk event imports."""
+    year = prompt_for_number("  Start date - Year (e.g., 2024): ", 1, 9999)
+    month = prompt_for_number("  Start date - Month (1-12): ", 1, 12)
+    while True:
+        day = prompt_for_number("  Start date - Day (1-31): ", 1, 31)
+        try:
+            event_date = datetime(year, month, day)
+            break
+        except ValueError as e:
+            print(f"  Invalid date: {e}")
+    start_hour = prompt_for_number("  Start time - Hour (0-23): ", 0, 23)
+    start_minute = prompt_for_number("  Start time - Minute (0-59): ", 0, 59)
+    start_dt = event_date.replace(hour=start_hour, minute=start_minute)
+
+    while True:
+        end_hour = prompt_for_number("  End time - Hour (0-23): ", 0, 23)
+        end_minute = prompt_for_number("  End time - Minute (0-59): ", 0, 59)
+        end_dt = event_date.replace(hour=end_hour, minute=end_minute)
+        if end_dt > start_dt:
+            break
+        print("  The end time must be after the start time.")
+
+    # Format the ISO 8601 datetime strings (e.g., 2024-06-01T10:00:00)
+    return (summary, start_dt.isoformat(), end_dt.isoformat())
+
+def read_events(stream):
+    """Read (summary, start_date, end_date) rows from CSV-formatted text.
+
+    Blank lines, a header row, and rows that don't have three fields with valid
+    ISO 8601 dates are skipped with a message.
+    """
+    reader = csv.reader(stream)
+    for row in reader:
+        if not row or row == ["summary", "start_date", "end_date"]:
+            continue
+        if len(row) != 3:
+            print(f"Skipping line {reader.line_num}: expected 3 fields, got {len(row)}.", file=sys.stderr)
+            continue
+
+        summary, start_date, end_date = (field.strip() for field in row)
+        try:
+            datetime.fromisoformat(start_date)
+            datetime.fromisoformat(end_date)
+        except ValueError as e:
+            print(f"Skipping line {reader.line_num}: {e}", file=sys.stderr)
+            continue
+
+        yield (summary, start_date, end_date)
+
+def create_csv(csv_file, batch_stream=None):
+    """Create a CSV file for bulk event imports.
+
+    If batch_stream is given, events are read from it in bulk (see read_events)
+    instead of being prompted for one field at a time.
+    """
     print("Creating a new CSV file for bulk events...")
 
     # Define the column headers
@@ -32,29 +82,49 @@ def create_csv(csv_file):
 
     # Open the CSV file for writing
     with open(csv_file, mode='w', newline='') as file:
-        writer = csv.DictWriter(file, fieldnames=headers)
+        writer = csv.writer(file)
 
         # Write the header row
-        writer.writeheader()
+        writer.writerow(headers)
+
+        # Write every event from the stream at once
+        if batch_stream is not None:
+            count = 0
+            for event in read_events(batch_stream):
+                writer.writerow(event)
+                count += 1
+            print(f"{count} events added to the CSV.")
 
-        # Allow the user to add multiple events
-        while True:
-            event = prompt_for_event()
-            writer.writerow(event)
-            print(f"Event '{event['summary']}' added to the CSV.")
+        # Otherwise, allow the user to add multiple events
+        else:
+            while True:
+                event = prompt_for_event()
+                writer.writerow(event)
+                print(f"Event '{event[0]}' added to the CSV.")
 
-            # Ask if the user wants to add another event
-            more = input("Add another event? (y/n): ").strip().lower()
-            if more != 'y':
-                break
+                # Ask if the user wants to add another event
+                more = input("Add another event? (y/n): ").strip().lower()
+                if more != 'y':
+                    break
 
     print(f"CSV file '{csv_file}' created successfully!")
 
 def main():
     """Main function to create a CSV for bulk imports."""
+    parser = argparse.ArgumentParser(description="Create a CSV file for bulk event imports.")
+    parser.add_argument("csv_file", nargs="?", help="the CSV file to create (asked for if omitted)")
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="read summary,start_date,end_date rows from standard input instead of prompting",
+    )
+    args = parser.parse_args()
+    if args.bulk and not args.csv_file:
+        parser.error("--bulk needs the CSV file name as an argument")
+
     print("Welcome to the Bulk Event CSV Creator!")
-    csv_file = input("Enter the name of the CSV file to create (e.g., schedule.csv): ").strip()
-    create_csv(csv_file)
+    csv_file = args.csv_file or input("Enter the name of the CSV file to create (e.g., schedule.csv): ").strip()
+    create_csv(csv_file, sys.stdin if args.bulk else None)
 
 if __name__ == "__main__":
     main()